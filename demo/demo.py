@@ -3,8 +3,11 @@ from __future__ import annotations
 
 import sys, pathlib, time, os
 from typing import List, Dict
+from itertools import groupby
+from operator import itemgetter
 import psycopg
 from psycopg import sql
+from psycopg.rows import tuple_row
 import pandas as pd
 
 # Make "src" importable when running from repo root
@@ -19,27 +22,95 @@ from src import data_loader
 from src import valid
 from src import config as cf
 
+# Statements sent per round-trip when applying DDL
+DDL_BATCH_SIZE = 25
+# Characters of DDL rendered in the preview; the full plan is offered as a download
+DDL_PREVIEW_CHARS = 50_000
+# SQL kept per failed statement for the error report
+ERR_SQL_CHARS = 4096
+# Log lines shown in the Logs panel; per-statement [OK] lines are only logged for small batches
+LOG_TAIL_LINES = 500
+LOG_OK_MAX_STATEMENTS = 100
+
+# Query templates for the preview helpers (built once; only identifiers vary per call)
+_COUNT_TMPL = sql.SQL("SELECT COUNT(*) FROM {}.{}")
+_SAMPLE_TMPL = sql.SQL("SELECT * FROM {}.{} LIMIT %s")
+
 # ---------- Small helpers ----------
 
-def pg_list_tables(dsn: str, schema: str):
+@st.cache_resource(show_spinner=False, validate=lambda conn: not conn.closed)
+def get_pg_conn(dsn: str) -> psycopg.Connection:
+    """
+    Long-lived autocommit Postgres connection shared across Streamlit reruns.
+    The pg_* helpers below use it unless a connection is injected via `_conn`
+    (underscore-prefixed so st.cache_data does not try to hash it).
+    """
+    return psycopg.connect(dsn, autocommit=True)
+
+def clear_pg_caches():
+    """Drop cached Postgres reads after the demo writes to the target (DDL/COPY)."""
+    pg_list_tables.clear()
+    pg_table_rowcount.clear()
+    pg_table_rowcounts.clear()
+    pg_sample_rows.clear()
+
+@st.cache_data(ttl=30, show_spinner=False)
+def pg_list_tables(dsn: str, schema: str, _conn: psycopg.Connection | None = None):
     """Return a list of table names in a Postgres schema."""
-    with psycopg.connect(dsn) as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT tablename
-                FROM pg_catalog.pg_tables
-                WHERE schemaname = %s
-                ORDER BY tablename
-                """,
-                (schema,)
-            )
-            return [r[0] for r in cur.fetchall()]
+    with (_conn or get_pg_conn(dsn)).cursor() as cur:
+        cur.execute(
+            """
+            SELECT tablename
+            FROM pg_catalog.pg_tables
+            WHERE schemaname = %s
+            ORDER BY tablename
+            """,
+            (schema,)
+        )
+        return [r[0] for r in cur.fetchall()]
 
-def expected_pg_tables_from_oracle_names(oracle_table_names: list[str]) -> list[str]:
-    """Normalize Oracle table names the same way DDL emitter does, to compare against PG."""
+def pg_ident_map_for(oracle_table_names: list[str]) -> Dict[str, str]:
+    """Map Oracle table names to Postgres names with one NameMapper, as the DDL emitter does."""
     nm = emit.NameMapper()
-    return [nm.pg_ident(t) for t in oracle_table_names]
+    return {t: nm.pg_ident(t) for t in oracle_table_names}
+
+@st.cache_data(show_spinner=False)
+def build_ddl(discovery: dict, schema: str) -> str:
+    """Compose the Postgres DDL plan for a discovery result (cached on its contents)."""
+    d = discovery
+
+    # Build (tdef, cols, pks) triples expected by compose_plan
+    # (columns arrive ordered by table_name, column_id)
+    cols_by_tbl: Dict[str, List[dict]] = {}
+    for tname, grp in groupby(d["cols"], key=itemgetter("table_name")):
+        cols_by_tbl[tname] = [{
+            "column_name": c["column_name"],
+            "data_type": c["data_type"],
+            "data_precision": c.get("data_precision"),
+            "data_scale": c.get("data_scale"),
+            "nullable": c.get("nullable", True),
+            "data_default": c.get("data_default"),
+        } for c in grp]
+
+    pk_by_tbl = {p["table_name"]: p.get("columns", []) for p in d["pks"]}
+    triples = (({"table_name": t}, cols_by_tbl.get(t, ()), pk_by_tbl.get(t)) for t in d["tables"])
+
+    nm = emit.NameMapper()
+    return emit.compose_plan(
+        schema=schema,
+        seq_defs=d["seqs"],
+        tables=triples,
+        fks=d["fks"],
+        indexes=d["idxs"],
+        namemap=nm
+    )
+
+@st.cache_data(show_spinner=False)
+def parse_table_filters(include_csv: str, exclude_csv: str) -> tuple[frozenset, frozenset]:
+    """Parse the comma-separated include/exclude inputs into lower-cased name sets."""
+    def parse(csv: str) -> frozenset:
+        return frozenset(t.strip().lower() for t in csv.split(",") if t.strip())
+    return parse(include_csv), parse(exclude_csv)
 
 def log(msg: str):
     # Only append to log buffer; do not render inline in the main area.
@@ -54,6 +125,10 @@ def ensure_state():
         st.session_state.ddl_sql = ""
     if "tables" not in st.session_state:
         st.session_state.tables = []
+    if "expected_pg_tables" not in st.session_state:
+        st.session_state.expected_pg_tables = set()
+    if "pg_ident_map" not in st.session_state:
+        st.session_state.pg_ident_map = {}
 
 def ensure_action_state():
     if "done" not in st.session_state:
@@ -125,54 +200,84 @@ def _mk_progress(total: int):
 def apply_statements_verbose(pg: cf.PostgresCfg, statements: List[str], on_progress=None):
     """
     Apply SQL statements to Postgres and stream verbose progress into the Streamlit UI.
-    Returns a list of (sql, exception) for failed statements (empty if none).
+    Returns a list of (statement #, sql, exception) for failed statements (empty if none);
+    stored SQL is capped at ERR_SQL_CHARS to bound memory when many statements fail.
     """
-    errs: List[tuple[str, Exception]] = []
+    errs: List[tuple[int, str, Exception]] = []
     try:
         with psycopg.connect(pg.dsn, autocommit=True) as conn:
             dbname = getattr(conn.info, "dbname", "postgres")
             log(f"Applying {len(statements)} statements to {dbname} ...")
+            log_ok = len(statements) <= LOG_OK_MAX_STATEMENTS
             with conn.cursor() as cur:
-                for i, stmt in enumerate(statements, 1):
-                    head = (stmt or "").splitlines()[0]
+                for start in range(0, len(statements), DDL_BATCH_SIZE):
+                    chunk = statements[start:start + DDL_BATCH_SIZE]
+                    end = start + len(chunk)
                     if on_progress:
-                        on_progress(i, f"Applying {i}/{len(statements)}: {head[:60]}")
+                        head = (chunk[0] or "").partition("\n")[0]
+                        on_progress(end, f"Applying {start + 1}-{end}/{len(statements)}: {head[:60]}")
                     try:
-                        cur.execute(stmt)
-                        log(f"[OK] {i}: {head[:100]}")
-                    except Exception as e:
-                        errs.append((stmt, e))
-                        log(f"\n[ERR] {i}: {head[:120]}\n--> {e}\n")
+                        # One round-trip for the whole chunk
+                        cur.execute("\n".join(chunk))
+                        if log_ok:
+                            for i, stmt in enumerate(chunk, start + 1):
+                                head = (stmt or "").partition("\n")[0]
+                                log(f"[OK] {i}: {head[:100]}")
+                        continue
+                    except Exception:
+                        # Chunk rolled back as a whole; replay per statement to attribute errors
+                        pass
+                    for i, stmt in enumerate(chunk, start + 1):
+                        head = (stmt or "").partition("\n")[0]
+                        try:
+                            cur.execute(stmt)
+                            if log_ok:
+                                log(f"[OK] {i}: {head[:100]}")
+                        except Exception as e:
+                            errs.append((i, stmt[:ERR_SQL_CHARS], e))
+                            log(f"[ERR] {i}")
             if errs:
-                first_stmt, first_err = errs[0]
-                first_head = (first_stmt or "").splitlines()[0]
+                # Format the per-statement errors once, as a single log entry
+                log("\n".join(
+                    f"[ERR] {i}: {stmt.partition(chr(10))[0][:120]}\n--> {e}" for i, stmt, e in errs
+                ))
+                first_idx, first_stmt, first_err = errs[0]
                 log("----- FIRST REAL ERROR SUMMARY -----")
-                log(f"Statement #{statements.index(first_stmt)+1}:\n{first_stmt}\n\nError:\n{first_err}\n")
+                log(f"Statement #{first_idx}:\n{first_stmt}\n\nError:\n{first_err}\n")
             else:
                 log(f" DDL applied to PostgreSQL ({dbname}) with no errors.")
     except Exception as e:
         log(f"Failed to connect/apply to Postgres: {e}")
     return errs
 
-def pg_table_rowcount(dsn: str, schema: str, table: str) -> int:
+@st.cache_data(ttl=30, show_spinner=False)
+def pg_table_rowcount(dsn: str, schema: str, table: str, _conn: psycopg.Connection | None = None) -> int:
     """Return row count for a table: schema.table."""
-    with psycopg.connect(dsn) as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                sql.SQL("SELECT COUNT(*) FROM {}.{}")
-                   .format(sql.Identifier(schema), sql.Identifier(table))
-            )
-            return int(cur.fetchone()[0])
-
-def pg_sample_rows(dsn: str, schema: str, table: str, limit: int = 50):
-    """Return (columns, rows) sample from schema.table."""
-    with psycopg.connect(dsn) as conn:
-        with conn.cursor() as cur:
-            query = sql.SQL("SELECT * FROM {}.{} LIMIT {}")
-            cur.execute(query.format(sql.Identifier(schema), sql.Identifier(table), sql.Literal(limit)))
-            cols = [d[0] for d in cur.description]
-            rows = cur.fetchall()
-            return cols, rows
+    with (_conn or get_pg_conn(dsn)).cursor() as cur:
+        cur.execute(_COUNT_TMPL.format(sql.Identifier(schema), sql.Identifier(table)))
+        return int(cur.fetchone()[0])
+
+@st.cache_data(ttl=30, show_spinner=False)
+def pg_table_rowcounts(dsn: str, schema: str, tables: List[str], _conn: psycopg.Connection | None = None) -> Dict[str, int]:
+    """Return exact row counts for many tables in schema, batched like the row-count validation."""
+    if not tables:
+        return {}
+    errors: Dict[int, str] = {}
+    counts = valid.count_pg(_conn or get_pg_conn(dsn), schema, tables, errors)
+    if errors:
+        raise RuntimeError(next(iter(errors.values())))
+    return {t: int(counts[i]) for i, t in enumerate(tables)}
+
+@st.cache_data(ttl=30, show_spinner=False)
+def pg_sample_rows(dsn: str, schema: str, table: str, limit: int = 50, _conn: psycopg.Connection | None = None):
+    """Return (columns, rows) sample from schema.table, streamed through a server-side cursor."""
+    conn = _conn or get_pg_conn(dsn)
+    with conn.transaction(), conn.cursor(name="oc2pg_sample", row_factory=tuple_row) as cur:
+        cur.itersize = limit
+        cur.execute(_SAMPLE_TMPL.format(sql.Identifier(schema), sql.Identifier(table)), (limit,))
+        cols = [d[0] for d in cur.description]
+        rows = cur.fetchmany(limit)
+        return cols, rows
 
 # ---------- UI ----------
 st.set_page_config(page_title="OC2PG Demo", layout="wide")
@@ -202,7 +307,7 @@ with st.sidebar:
     ora_service = st.text_input("Oracle service", "XEPDB1")
     ora_user = st.text_input("Oracle user", "test_user")
     ora_pass = st.text_input("Oracle password", type="password", value="test_pass")
-    ora_arraysize = st.number_input("Oracle arraysize", 1000, 500000, 10000, step=1000)
+    ora_arraysize = st.number_input("Oracle arraysize", 1000, 500000, 50000, step=1000)
 
     # Postgres
     pg_user = st.text_input("Postgres user", "postgres")
@@ -232,8 +337,6 @@ oracle_cfg = cf.OracleCfg(owner=owner, dsn=oracle_dsn, user=ora_user, password=o
 pg_dsn = f"postgresql://{pg_user}:{pg_pass}@{pg_host}:{pg_port}/{pg_db}"
 postgres_cfg = cf.PostgresCfg(dsn=pg_dsn, schema=pg_schema, copy_parallelism=int(pg_parallel), copy_batch_rows=int(pg_batch_rows))
 
-include_tables = [t.strip() for t in include_csv.split(",") if t.strip()]
-exclude_tables = [t.strip() for t in exclude_csv.split(",") if t.strip()]
 
 # ---------- Main area ----------
 
@@ -243,6 +346,7 @@ if btn_discover:
     st.session_state.discovery = None
     st.session_state.ddl_sql = ""
     st.session_state.tables = []
+    st.session_state.expected_pg_tables = set()
 
     update, done = _mk_progress(4)
     update(1, "Connecting to Oracle…")
@@ -259,24 +363,30 @@ if btn_discover:
         log(f"Owner = {ora_owner or '(unknown)'}")
         update(2, "Fetching metadata from Oracle…")
 
-        tables_raw = intro.get_tables(owner=ora_owner)
+        meta = intro.get_all(owner=ora_owner)
+        tables_raw = meta["tables"]
         # apply include/exclude filters client-side as well
-        if include_tables:
-            want = {t.lower() for t in include_tables}
+        want, drop = parse_table_filters(include_csv, exclude_csv)
+        if want:
             tables_raw = [r for r in tables_raw if r["table_name"].lower() in want]
-        if exclude_tables:
-            drop = {t.lower() for t in exclude_tables}
+        if drop:
             tables_raw = [r for r in tables_raw if r["table_name"].lower() not in drop]
 
         tables = [r["table_name"] for r in tables_raw]
-        cols   = intro.get_columns(owner=ora_owner)
-        pks    = intro.get_pk(owner=ora_owner)
-        fks    = intro.get_fk(owner=ora_owner)
-        idxs   = intro.get_indexes(owner=ora_owner)
-        seqs   = intro.get_sequences(owner=ora_owner)
-
-        st.session_state.discovery = dict(tables=tables, cols=cols, pks=pks, fks=fks, idxs=idxs, seqs=seqs, owner=ora_owner)
+        cols   = meta["cols"]
+        pks    = meta["pks"]
+        fks    = meta["fks"]
+        idxs   = meta["idxs"]
+        seqs   = meta["seqs"]
+
+        num_rows = {r["table_name"]: r.get("num_rows") for r in tables_raw}
+        row_lens = {r["table_name"]: r.get("avg_row_len") for r in tables_raw}
+        st.session_state.discovery = dict(tables=tables, cols=cols, pks=pks, fks=fks, idxs=idxs, seqs=seqs, owner=ora_owner,
+                                          num_rows=num_rows, row_lens=row_lens)
         st.session_state.tables = tables
+        # Postgres names the DDL will create; reused by the Apply DDL proof on every rerun
+        st.session_state.pg_ident_map = pg_ident_map_for(tables)
+        st.session_state.expected_pg_tables = set(st.session_state.pg_ident_map.values())
 
         update(3, "Rendering previews…")
 
@@ -303,10 +413,8 @@ if btn_discover:
                     max_selections=10,
                 )
                 if st.button("Compute exact counts"):
-                    exact = []
-                    for t in pick:
-                        n = intro.count_table(owner=ora_owner or oracle_cfg.owner, table_name=t)
-                        exact.append({"Table": t, "COUNT(*)": n})
+                    counts = intro.count_tables(owner=ora_owner or oracle_cfg.owner, table_names=pick)
+                    exact = [{"Table": t, "COUNT(*)": n} for t, n in counts.items()]
                     st.dataframe(pd.DataFrame(exact), use_container_width=True)
         else:
             st.info("No tables discovered.")
@@ -351,32 +459,7 @@ if btn_emit:
         update, done = _mk_progress(2)
         update(1, "Composing DDL plan…")
 
-        # Build (tdef, cols, pks) triples expected by compose_plan
-        cols_by_tbl: Dict[str, List[dict]] = {}
-        for c in d["cols"]:
-            cols_by_tbl.setdefault(c["table_name"], []).append({
-                "column_name": c["column_name"],
-                "data_type": c["data_type"],
-                "data_precision": c.get("data_precision"),
-                "data_scale": c.get("data_scale"),
-                "nullable": c.get("nullable", True),
-                "data_default": c.get("data_default"),
-            })
-
-        pk_by_tbl = {p["table_name"]: p.get("columns", []) for p in d["pks"]}
-        triples = []
-        for t in d["tables"]:
-            triples.append(({"table_name": t}, cols_by_tbl.get(t, []), pk_by_tbl.get(t)))
-
-        nm = emit.NameMapper()
-        ddl_sql = emit.compose_plan(
-            schema=postgres_cfg.schema,
-            seq_defs=d["seqs"],
-            tables=triples,
-            fks=d["fks"],
-            indexes=d["idxs"],
-            namemap=nm
-        )
+        ddl_sql = build_ddl(d, postgres_cfg.schema)
         st.session_state.ddl_sql = ddl_sql
 
         st.session_state.done["emit"] = True
@@ -384,7 +467,11 @@ if btn_emit:
         st.session_state.done["copy"] = False
         st.session_state.done["validate"] = False
 
-        st.code(ddl_sql, language="sql")
+        st.download_button("Download DDL", data=ddl_sql, file_name="schema.sql", mime="text/plain")
+        if len(ddl_sql) > DDL_PREVIEW_CHARS:
+            st.code(ddl_sql[:DDL_PREVIEW_CHARS] + "\n-- … truncated; download for full file", language="sql")
+        else:
+            st.code(ddl_sql, language="sql")
         update(2, "DDL generation complete.")
         done()
         log("DDL generated.")
@@ -395,12 +482,13 @@ if btn_apply:
         st.warning("Generate DDL first.")
     else:
         log("Applying DDL to Postgres…")
-        stmts = [s.strip() + ";" for s in st.session_state.ddl_sql.split(";") if s.strip()]
+        stmts = list(emit.iter_statements(st.session_state.ddl_sql))
         update, done = _mk_progress(len(stmts))
         errs = apply_statements_verbose(postgres_cfg, stmts, on_progress=update)
+        clear_pg_caches()
         if errs:
             st.error(f"Some statements failed: {len(errs)}")
-            for i, (sql, err) in enumerate(errs[:10], 1):
+            for i, (_, sql, err) in enumerate(errs[:10], 1):
                 st.write(f"[ERR {i}] {err}")
                 with st.expander(f"SQL {i}"):
                     st.code(sql, language="sql")
@@ -418,9 +506,11 @@ if btn_apply:
         # --- Proof the DDL applied: compare expected vs actual in Postgres ---
         if st.session_state.discovery:
             d = st.session_state.discovery
-            exp = set(expected_pg_tables_from_oracle_names(d["tables"]))
+            exp = st.session_state.expected_pg_tables
+            pgconn = None
             try:
-                actual = set(pg_list_tables(postgres_cfg.dsn, postgres_cfg.schema))
+                pgconn = get_pg_conn(postgres_cfg.dsn)
+                actual = set(pg_list_tables(postgres_cfg.dsn, postgres_cfg.schema, _conn=pgconn))
             except Exception as e:
                 st.error(f"Could not verify in Postgres: {e}")
                 actual = set()
@@ -447,9 +537,9 @@ if btn_apply:
                 st.write("\n**Pick a table to preview data:**")
                 sel = st.selectbox("Table", options=common, index=0, key="preview_table")
                 try:
-                    cnt = pg_table_rowcount(postgres_cfg.dsn, postgres_cfg.schema, sel)
+                    cnt = pg_table_rowcount(postgres_cfg.dsn, postgres_cfg.schema, sel, _conn=pgconn)
                     st.info(f"Row count for `{sel}`: {cnt}")
-                    cols, rows = pg_sample_rows(postgres_cfg.dsn, postgres_cfg.schema, sel, limit=100)
+                    cols, rows = pg_sample_rows(postgres_cfg.dsn, postgres_cfg.schema, sel, limit=100, _conn=pgconn)
                     if rows:
                         df = pd.DataFrame(rows, columns=cols)
                         st.dataframe(df, use_container_width=True, height=300)
@@ -459,13 +549,11 @@ if btn_apply:
                     st.error(f"Preview failed for {sel}: {e}")
 
                 with st.expander("Quick summary counts"):
-                    summary = []
-                    for t in common:
-                        try:
-                            c = pg_table_rowcount(postgres_cfg.dsn, postgres_cfg.schema, t)
-                        except Exception as e:
-                            c = None
-                        summary.append({"table": t, "rows": c})
+                    try:
+                        counts = pg_table_rowcounts(postgres_cfg.dsn, postgres_cfg.schema, common, _conn=pgconn)
+                    except Exception as e:
+                        counts = {}
+                    summary = [{"table": t, "rows": counts.get(t)} for t in common]
                     sdf = pd.DataFrame(summary)
                     st.dataframe(sdf, use_container_width=True, height=260)
             else:
@@ -480,9 +568,10 @@ if btn_copy:
         log("Copying data with COPY (parallel)…")
 
         # Build TableSpec list for the DataLoader from discovery metadata
-        cols_by_tbl: Dict[str, List[str]] = {}
-        for c in d["cols"]:
-            cols_by_tbl.setdefault(c["table_name"], []).append(c["column_name"])
+        cols_by_tbl: Dict[str, List[str]] = {
+            tname: [c["column_name"] for c in grp]
+            for tname, grp in groupby(d["cols"], key=itemgetter("table_name"))
+        }
 
         wanted_tables: List[str] = d["tables"]  # already filtered by include/exclude during discovery
         specs: List[cf.TableSpec] = [
@@ -491,6 +580,8 @@ if btn_copy:
                 name=tname,
                 columns=cols_by_tbl.get(tname, []),
                 pg_schema=postgres_cfg.schema,
+                estimated_rows=d.get("num_rows", {}).get(tname),
+                avg_row_len=d.get("row_lens", {}).get(tname),
                 where_clause=None,
             )
             for tname in wanted_tables
@@ -505,7 +596,11 @@ if btn_copy:
                 loader = data_loader.DataLoader(oracle_cfg, postgres_cfg, cf.OutputCfg())
 
                 # Use the DataLoader's bulk API to migrate all tables
-                stats = loader.load_schema(specs)
+                try:
+                    stats = loader.load_schema(specs, fks=d["fks"])
+                finally:
+                    loader.close()
+                clear_pg_caches()
 
                 st.session_state.done["copy"] = True
                 st.session_state.done["validate"] = False
@@ -522,12 +617,12 @@ if btn_copy:
                 if good_tables:
                     sel = st.selectbox("Preview a loaded table", options=sorted(good_tables))
                     # Map Oracle table name -> Postgres identifier (same normalization as DDL emitter)
-                    nm_preview = emit.NameMapper()
-                    pg_sel = nm_preview.pg_ident(sel)
+                    pg_sel = st.session_state.pg_ident_map.get(sel) or emit.NameMapper().pg_ident(sel)
                     try:
-                        cnt = pg_table_rowcount(postgres_cfg.dsn, postgres_cfg.schema, pg_sel)
+                        pgconn = get_pg_conn(postgres_cfg.dsn)
+                        cnt = pg_table_rowcount(postgres_cfg.dsn, postgres_cfg.schema, pg_sel, _conn=pgconn)
                         st.info(f"Row count for `{sel}` (PG: `{pg_sel}`): {cnt}")
-                        cols, rows = pg_sample_rows(postgres_cfg.dsn, postgres_cfg.schema, pg_sel, limit=100)
+                        cols, rows = pg_sample_rows(postgres_cfg.dsn, postgres_cfg.schema, pg_sel, limit=100, _conn=pgconn)
                         if rows:
                             df = pd.DataFrame(rows, columns=cols)
                             st.dataframe(df, use_container_width=True, height=300)
@@ -564,5 +659,10 @@ if btn_validate:
 
 st.divider()
 st.subheader("Logs")
-for line in st.session_state.logs:
-    st.text(line)
\ No newline at end of file
+st.text_area(
+    "Logs",
+    value="\n".join(st.session_state.logs[-LOG_TAIL_LINES:]),
+    height=300,
+    disabled=True,
+    label_visibility="collapsed",
+)
\ No newline at end of file
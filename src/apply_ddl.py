@@ -2,27 +2,61 @@ from typing import Iterable
 import psycopg
 from config import PostgresCfg
 from typer import secho
+from retry import with_retry
+from ddl_emit import iter_statements
+
+# Statements sent per round-trip; a failing batch is replayed one statement at a time.
+DDL_BATCH_SIZE = 25
 
 def apply_statements(pg: PostgresCfg, statements: Iterable[str]) -> None:
-    """ Applies list of SQL statements to PostgresSQL database. """
+    """ Applies list of SQL statements to PostgresSQL database.
+    A dropped connection is reopened before the next retry (statements run in autocommit). """
 
+    statements = list(statements)
     first_error = None
+    pgconn = None
+
+    def execute(sql: str) -> None:
+        nonlocal pgconn
+        # A lost connection reports closed; retrying on it would only fail again
+        if pgconn is None or pgconn.closed:
+            pgconn = psycopg.connect(pg.dsn, autocommit=True)
+        pgconn.execute(sql)
+
     try:
-        with psycopg.connect(pg.dsn, autocommit=True) as pgconn:
-            with pgconn.cursor() as cur:
-                secho(f"Applying {len(statements)} statements to migration_target ...", fg="cyan")
-                for i, stmt in enumerate(statements, 1):
-                    try:
-                        cur.execute(stmt)
-                        head = stmt.splitlines()[0]
-                        secho(f"[OK] {i}: {head[:100]}", fg="cyan")
-                    except Exception as e:
-                        if first_error is None:
-                            first_error = (i, stmt, e)
-                        secho(f"\n[ERR] {i}: {stmt.splitlines()[0][:120]}\n--> {e}\n", fg="red")
+        pgconn = psycopg.connect(pg.dsn, autocommit=True)
+        secho(f"Applying {len(statements)} statements to migration_target ...", fg="cyan")
+        for start in range(0, len(statements), DDL_BATCH_SIZE):
+            chunk = statements[start:start + DDL_BATCH_SIZE]
+            try:
+                # One simple-query round-trip for the whole chunk
+                with_retry(execute, "\n".join(chunk))
+                for i, stmt in enumerate(chunk, start + 1):
+                    head = stmt.partition("\n")[0]
+                    secho(f"[OK] {i}: {head[:100]}", fg="cyan")
+                continue
+            except Exception:
+                if pgconn.closed:
+                    # Still no connection after the retries' reconnects: give up on the rest
+                    raise
+                # Batch rolled back as a whole; replay per statement for error attribution
+            for i, stmt in enumerate(chunk, start + 1):
+                head = stmt.partition("\n")[0]
+                try:
+                    with_retry(execute, stmt)
+                    secho(f"[OK] {i}: {head[:100]}", fg="cyan")
+                except Exception as e:
+                    if pgconn.closed:
+                        raise
+                    if first_error is None:
+                        first_error = (i, stmt, e)
+                    secho(f"\n[ERR] {i}: {head[:120]}\n--> {e}\n", fg="red")
     except Exception as e:
         secho(f"Failed to connect/apply to Postgres: {e}", fg="red")
         return
+    finally:
+        if pgconn is not None:
+            pgconn.close()
 
     if first_error:
         i, stmt, e = first_error
@@ -31,9 +65,22 @@ def apply_statements(pg: PostgresCfg, statements: Iterable[str]) -> None:
     else:
         secho(" DDL applied to PostgreSQL (migration_target) with no errors.", fg="cyan")
 
+def apply_plan(pgconn: psycopg.Connection, plan_sql: str) -> int:
+    """
+    Applies a compose_plan script in one transaction using pipeline mode: statements are
+    sent without waiting for each result, so the replay costs a handful of round-trips.
+    Any failure rolls the whole plan back and re-raises. Returns the statement count.
+    """
+
+    stmts = list(iter_statements(plan_sql))
+    with pgconn.transaction(), pgconn.pipeline(), pgconn.cursor() as cur:
+        for stmt in stmts:
+            cur.execute(stmt)
+    return len(stmts)
+
 def apply_sql_file(pg: PostgresCfg, path: str) -> None:
     """ Executes SQL commands on PostgresSQL from file. """
-    
+
     sql = open(path, "r", encoding="utf-8").read()
     with psycopg.connect(pg.dsn, autocommit=True) as conn:
         conn.execute(sql)
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
 import yaml
 from pathlib import Path
 
@@ -9,7 +9,7 @@ class OracleCfg:
     dsn: str
     user: str
     password: str
-    arraysize: int = 10000
+    arraysize: int = 50000
 
 @dataclass
 class PostgresCfg:
@@ -17,6 +17,8 @@ class PostgresCfg:
     schema: str = "public"
     copy_parallelism: int = 4
     copy_batch_rows: int = 50000
+    copy_format: str = "binary"  # "binary", "csv" or "arrow"
+    shard_rows: int = 5_000_000  # estimated rows per concurrent COPY session on one table
 
 @dataclass
 class MigrateCfg:
@@ -31,6 +33,7 @@ class OutputCfg:
     dir: str = "./out"
     plan_sql: str = "plan.sql"
     report_md: str = "report.md"
+    fast_load: bool = False  # UNLOGGED + drop secondary indexes during COPY, rebuild after
 
 @dataclass
 class Config:
@@ -50,9 +53,14 @@ class TableSpec:
         columns: Ordered list of column names to select/copy.
         pg_schema: Target PostgreSQL schema (e.g., 'hr').
         estimated_rows: Optional row count for progress (from Oracle stats).
+        avg_row_len: Optional average row length in bytes (Oracle stats); weights load scheduling.
         where_clause: Optional Oracle SQL predicate (without 'WHERE') to restrict rows.
         pg_table: Optional Postgres table name override (normalized via NameMapper).
         pg_columns: Optional Postgres column name list override (normalized via NameMapper).
+        pg_type_oids: Optional Postgres type OIDs of the target columns (binary COPY); looked up if unset.
+        _compiled: Oracle SELECT text and psycopg COPY statement, filled once by DataLoader._prepare_spec.
+        _ora_from: Quoted `"OWNER"."TABLE"` target, built at construction.
+        _ora_select: Quoted `SELECT cols FROM "OWNER"."TABLE"` (no WHERE), built at construction.
     """
     owner: str
     name: str
@@ -62,6 +70,19 @@ class TableSpec:
     where_clause: Optional[str] = None
     pg_table: Optional[str] = None
     pg_columns: Optional[List[str]] = None
+    pg_type_oids: Optional[List[int]] = None
+    avg_row_len: Optional[int] = None
+    _compiled: Optional[Tuple[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _ora_from: str = field(default="", init=False, repr=False, compare=False)
+    _ora_select: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Table/column names come from the Oracle dictionary as stored (case included); only the
+        # user-supplied owner is normalized and escaped
+        cols = ", ".join(f'"{c}"' for c in self.columns)
+        owner = self.owner.replace('"', '""').upper()
+        self._ora_from = f'"{owner}"."{self.name}"'
+        self._ora_select = f"SELECT {cols} FROM {self._ora_from}"
 
 def load_config(path: str) -> Config:
     data = yaml.safe_load(Path(path).read_text())
@@ -1,23 +1,94 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
-import io, csv, decimal, datetime, sys, hashlib
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+import io, csv, decimal, datetime, sys, hashlib, queue, threading, math
 from contextlib import contextmanager
+from dataclasses import replace
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 import oracledb
 import psycopg
 from psycopg import sql
+from psycopg.copy import QueuedLibpqWriter
+
+try:
+    import pyarrow
+    import adbc_driver_postgresql.dbapi as adbc_pg
+except ImportError:  # optional: copy_format="arrow" falls back to binary COPY
+    pyarrow = adbc_pg = None
 
 from config import OracleCfg, PostgresCfg, OutputCfg, TableSpec
+from retry import RETRYABLE_ERRORS, with_retry
+import pools
 
 NULL_SENTINEL = r"\N"
 
+# Trailing placeholder takes extra options (", FREEZE")
+COPY_CSV = "COPY {}.{} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N', QUOTE '\"'{})"
+COPY_BINARY = "COPY {}.{} ({}) FROM STDIN WITH (FORMAT binary{})"
+
+# One row per extent of a table (all partitions): its first and last possible ROWID and its size
+ROWID_EXTENTS_SQL = (
+    "SELECT ROWIDTOCHAR(DBMS_ROWID.ROWID_CREATE(1, o.data_object_id, e.relative_fno, e.block_id, 0)), "
+    "ROWIDTOCHAR(DBMS_ROWID.ROWID_CREATE(1, o.data_object_id, e.relative_fno, e.block_id + e.blocks - 1, 32767)), "
+    "e.blocks "
+    "FROM dba_extents e JOIN all_objects o ON o.owner = e.owner AND o.object_name = e.segment_name "
+    "AND NVL(o.subobject_name, '-') = NVL(e.partition_name, '-') AND o.object_type LIKE 'TABLE%' "
+    "WHERE e.owner = :owner AND e.segment_name = :name AND e.segment_type LIKE 'TABLE%' "
+    "ORDER BY o.data_object_id, e.relative_fno, e.block_id"
+)
+
+# Dumper OID substitutions for binary COPY. The server decodes each field with the column's own
+# receive function, so only the wire layout has to match: oracledb returns TIMESTAMP WITH TIME ZONE
+# as naive datetimes, which the timestamptz (1184) dumper rejects; timestamp (1114) has the same layout.
+# The server reads those values as UTC, so timestamptz targets are selected through SYS_EXTRACT_UTC
+# (see _oracle_select).
+TIMESTAMPTZ_OID = 1184
+_BINARY_DUMP_OIDS = {TIMESTAMPTZ_OID: 1114}
+
+# text, bpchar, varchar: their binary dumpers only accept str (the DDL maps unknown Oracle types,
+# e.g. TIMESTAMP(6) or INTERVAL DAY TO SECOND, to text)
+_TEXT_OIDS = frozenset((25, 1042, 1043))
+
+# Oracle batches fetched ahead of the COPY writer (bounds memory to depth * copy_batch_rows rows)
+PIPELINE_DEPTH = 4
+# Encoded CSV payloads held between the encode thread and the COPY writer
+ENCODE_DEPTH = 2
+# Tables estimated below this many rows are loaded together in one transaction via INSERT ... unnest()
+SMALL_TABLE_ROWS = 1000
+# Per-table fetch sizing: aim for ~32 MiB per round-trip, bounded by row count
+TARGET_FETCH_BYTES = 32 * 1024 * 1024
+MIN_ARRAYSIZE = 1000
+LOB_WIDTH_GUESS = 32
+_END = object()
+# Per-thread scratch StringIO + csv.writer for rows that need quoting, reused across batches
+_TLS = threading.local()
+
+def _hex(v: Any) -> str:
+    return "\\x" + bytes(v).hex()
+
+# CSV field encoders keyed on exact type; subclasses fall back to isinstance checks in _to_csv_field
+_DISPATCH: Dict[type, Callable[[Any], str]] = {
+    int: str,
+    float: str,
+    decimal.Decimal: str,
+    str: lambda v: v,
+    datetime.datetime: lambda v: v.isoformat(sep=" "),
+    datetime.date: datetime.date.isoformat,
+    datetime.time: datetime.time.isoformat,
+    bytes: _hex,
+    bytearray: _hex,
+    memoryview: _hex,
+}
+
+
 class DataLoader:
     """
-    Streams rows from Oracle to Postgres using COPY CSV.
+    Streams rows from Oracle to Postgres using COPY (binary by default, CSV or Arrow via `copy_format`).
     Keep transforms minimal; depend on DDL/type mapping to have compatible target types.
+    Batches go straight from the Oracle cursor into the COPY stream; nothing is staged on disk.
+    `out_dir` only receives bad-batch dumps and is created on first use.
     """
     def __init__(
         self,
@@ -29,15 +100,23 @@ class DataLoader:
         self.pg = pg
         self.out = out
         self.out_dir = Path(out.dir)
-        self.out_dir.mkdir(parents=True, exist_ok=True)
 
     # Public APIs
 
-    def load_schema(self, tables: List[TableSpec]) -> Dict[str, Dict[str, Any]]:
+    def load_schema(self, tables: List[TableSpec], fks: Optional[List[Dict]] = None) -> Dict[str, Dict[str, Any]]:
         """ Loads all tables in the schema from Oracle to PostgresSQL, optionally in parallel. Returns stats per table.
 
+        Parallel loads run one table per worker process (own GIL, own Oracle/Postgres connections).
+        When `fks` is given, referenced parent tables are loaded in an earlier wave than their children.
+        Tables whose `estimated_rows` exceed `shard_rows` are split across several concurrent COPY
+        sessions (see load_table_parallel); they run while the process pool is idle so the total
+        number of sessions stays within `copy_parallelism`. Within a wave, tables are started in
+        descending estimated size (`estimated_rows` x `avg_row_len`). Tables estimated below
+        SMALL_TABLE_ROWS skip COPY and are inserted together in one transaction (see _load_small_tables).
+
         Args:
             tables: List of TableSpec objects to migrate.
+            fks: Optional foreign key dicts (as returned by OracleIntrospector.get_fk).
 
         Returns:
             Mapping of table name -> stats dict, e.g.:
@@ -48,38 +127,92 @@ class DataLoader:
         """
         stats: Dict[str, Dict[str, Any]] = {}
 
+        if self._copy_format() == "binary":
+            self._prefill_type_oids(tables)
+
+        # Small tables first, all in one transaction; any that fail there go through COPY below.
+        # fast_load targets keep the regular per-table path, which applies UNLOGGED / index drops.
+        small = [spec for spec in tables if spec.estimated_rows is not None and spec.estimated_rows < SMALL_TABLE_ROWS]
+        if len(small) > 1 and not getattr(self.out, "fast_load", False):
+            ordered = [spec for wave in self._fk_waves(small, fks or []) for spec in wave]
+            try:
+                # One transaction for all of them, so a rerun after a transient error starts clean
+                stats.update(with_retry(self._load_small_tables, ordered))
+            except Exception as e:
+                # Connection loss or a failed final COMMIT (e.g. a deferred FK) rolled everything back
+                sys.stderr.write(f"[WARN] Small-table batch failed, loading them with COPY: {e!r}\n")
+            tables = [spec for spec in tables if spec.name not in stats]
+
         # Sequential path
-        if self.pg.copy_parallelism <= 1 or len(tables) <= 1:
+        if self.pg.copy_parallelism <= 1 or not tables or (len(tables) == 1 and self._shard_count(tables[0]) <= 1):
             for spec in tables:
                 try:
                     stats[spec.name] = self.load_table(spec)
                 except Exception as e:
                     stats[spec.name] = {"status": "error", "error": repr(e)}
+            self._checkpoint()
             return stats
 
-        # Parallel across tables
-        with ThreadPoolExecutor(max_workers=self.pg.copy_parallelism) as ex:
-            futs = {ex.submit(self.load_table, spec): spec for spec in tables}
-            for fut in as_completed(futs):
-                spec = futs[fut]
-                try:
-                    stats[spec.name] = fut.result()
-                except Exception as e:
-                    stats[spec.name] = {"status": "error", "error": repr(e)}
+        # Parallel across tables, one process per worker
+        # Each worker builds its own DataLoader (and connection pools, keyed by pid) once, so tasks only pickle the spec
+        with ProcessPoolExecutor(
+            max_workers=self.pg.copy_parallelism,
+            initializer=_init_worker,
+            initargs=(self.ora, self.pg, self.out),
+        ) as ex:
+            for wave in self._fk_waves(tables, fks or []):
+                # Largest tables (rows x avg row length) first, so the longest load doesn't start last
+                wave = sorted(wave, key=lambda spec: -(spec.estimated_rows or 0) * (spec.avg_row_len or 1))
+                for spec in wave:
+                    n = self._shard_count(spec)
+                    if n > 1:
+                        try:
+                            stats[spec.name] = self.load_table_parallel(spec, n)
+                        except Exception as e:
+                            stats[spec.name] = {"status": "error", "error": repr(e)}
+                futs = {ex.submit(_worker_load_table, spec): spec for spec in wave if spec.name not in stats}
+                for fut in as_completed(futs):
+                    spec = futs[fut]
+                    try:
+                        stats[spec.name] = fut.result()
+                    except Exception as e:
+                        stats[spec.name] = {"status": "error", "error": repr(e)}
+        self._checkpoint()
         return stats
 
     def load_table(self, spec: TableSpec) -> Dict[str, Any]:
-        """ Loads single table from Oracle to PostgresSQL. To be used as a thread of load_schema.
+        """ Loads single table from Oracle to PostgresSQL. To be used as a worker of load_schema.
+        With `OutputCfg.fast_load`, the target is made UNLOGGED and stripped of secondary
+        indexes for the COPY, then restored (see _fast_load).
+
+        Args:
+            spec: TableSpec describing owner, table, columns, and target schema.
+
+        Returns:
+            Stats dict with at least: {'status': 'ok'|'error', 'rows': int, 'failed_batches': int}.
+        """
+        with self._fast_load(spec):
+            # The table is one transaction, so a transient failure rolls back cleanly and can be rerun
+            return with_retry(self._copy_table, spec)
+
+    def _copy_table(self, spec: TableSpec, fmt: Optional[str] = None) -> Dict[str, Any]:
+        """ Copies the rows selected by `spec` (a whole table or one shard) into Postgres.
 
                 Behavior:
             - Builds a SELECT for the specified columns (and optional WHERE).
-            - Iterates Oracle rows in batches.
-            - Serializes batches to CSV bytes with NULL_SENTINEL.
-            - Writes to Postgres using COPY ... FROM STDIN.
+            - Iterates Oracle rows in batches on a background thread, overlapping fetch and COPY
+              (CSV format adds a separate encoding thread between the two).
+            - Binary format: hands native rows to psycopg's binary adapters via write_row(), with
+              non-str values for text-like targets rendered as text first (see _text_row); a row
+              that fails to encode fails the table (rows before it are already in the stream).
+            - CSV format: serializes batches to CSV bytes with NULL_SENTINEL.
+            - Writes to Postgres using COPY ... FROM STDIN (with FREEZE when a whole table loads
+              into an empty target, see _truncate_for_freeze).
             - Defers constraints for the session if target FKs are deferrable.
 
         Args:
             spec: TableSpec describing owner, table, columns, and target schema.
+            fmt: COPY format override; defaults to the effective `copy_format`.
 
         Returns:
             Stats dict with at least: {'status': 'ok'|'error', 'rows': int, 'failed_batches': int}.
@@ -87,31 +220,39 @@ class DataLoader:
         Raises:
             Exception: Propagates unexpected connection/IO errors (caller may catch).
         """
+        fmt = fmt or self._copy_format()
+        if fmt == "arrow":
+            try:
+                return self._load_table_arrow(spec)
+            except Exception as e:
+                # Nothing was committed; Arrow can't carry some types (LOBs, XMLTYPE, ...)
+                sys.stderr.write(f"[WARN] Arrow load failed for {spec.name}, using binary COPY: {e!r}\n")
+                fmt = "binary"
+
         total_rows = 0
         failed_batches = 0
 
-        ora_sql = self._oracle_select(spec)
+        binary = fmt == "binary"
 
         with self._oracle_conn() as oc, self._pg_conn() as pc:
+            if binary and spec.pg_type_oids is None:
+                with pc.cursor() as pgc:
+                    spec.pg_type_oids = self._pg_column_types(
+                        pgc, spec.pg_schema, spec.name.lower(), [c.lower() for c in spec.columns]
+                    )
+                # The SELECT depends on the target types (timestamptz columns are read as UTC)
+                spec._compiled = None
+            ora_sql, copy_stmt = self._prepare_spec(spec)
+
             with oc.cursor() as cur:
-                cur.arraysize = self.ora.arraysize
-                self._set_output_handlers(cur)
-                # Execute SELECT
-                cur.execute(ora_sql)
-
-                # Map Oracle identifiers to Postgres target identifiers (lowercase, unquoted)
-                target_table = spec.name.lower()
-                target_cols = [c.lower() for c in spec.columns]
-
-                # Prepare COPY statement targeting Postgres identifiers
-                cols_sql = sql.SQL(',').join(sql.Identifier(c) for c in target_cols)
-                copy_stmt = sql.SQL(
-                    "COPY {}.{} ({}) FROM STDIN WITH (FORMAT csv, NULL '\\N', QUOTE '\"')"
-                ).format(
-                    sql.Identifier(spec.pg_schema),
-                    sql.Identifier(target_table),
-                    cols_sql,
-                )
+                # Row width is unknown until execute; keep the first round-trip at the safe lower bound
+                cur.arraysize = min(MIN_ARRAYSIZE, self.ora.arraysize)
+                cur.prefetchrows = cur.arraysize + 1
+                if binary:
+                    self._set_output_handlers(cur)
+                # Execute SELECT; CLOB/NCLOB arrive as str and BLOB as bytes, no locator round-trips
+                cur.execute(ora_sql, fetch_lobs=False)
+                cur.arraysize = self._fetch_arraysize(cur)
 
                 with pc.cursor() as pgc:
                     # Best-effort: defer constraints if target FKs are deferrable
@@ -120,23 +261,71 @@ class DataLoader:
                     except Exception:
                         pass
 
+                    # The whole table is one transaction (committed by _pg_conn). Bulk load is
+                    # re-runnable, so don't wait on WAL fsync at commit; load_schema checkpoints at the end.
+                    try:
+                        pgc.execute(
+                            "SET LOCAL synchronous_commit = off; SET LOCAL client_min_messages = warning;"
+                        )
+                    except Exception:
+                        pass
+                    # Superuser-only on most servers; the savepoint keeps a refusal from aborting the load
+                    try:
+                        with pc.transaction():
+                            pgc.execute("SET LOCAL wal_compression = on;")
+                    except Exception:
+                        pass
+
                     # Temporarily relax FK enforcement during bulk load to avoid false ordering failures.
                     # This is scoped to the current transaction via SET LOCAL.
                     tried_relax = False
                     try:
-                        pgc.execute("SET LOCAL session_replication_role = 'replica';")
+                        with pc.transaction():
+                            pgc.execute("SET LOCAL session_replication_role = 'replica';")
                         tried_relax = True
                     except Exception:
                         # If not allowed (e.g., lacking perms), continue normally.
                         tried_relax = False
 
+                    # A whole, still empty table is truncated in this transaction so COPY can
+                    # write the rows already frozen (no anti-wraparound vacuum pass later)
+                    if spec.where_clause is None and self._truncate_for_freeze(spec, pgc):
+                        copy_stmt = self._copy_statement(spec, freeze=True)
+
                     try:
-                        with pgc.copy(copy_stmt) as cp:
-                            for batch in self._iter_oracle_batches(cur, len(spec.columns)):
+                        # Network sends run on psycopg's writer thread, in <=128 KiB chunks,
+                        # so encoding the next batch overlaps shipping the current one
+                        with pgc.copy(copy_stmt, writer=QueuedLibpqWriter(pgc)) as cp:
+                            if binary:
+                                cp.set_types([_BINARY_DUMP_OIDS.get(oid, oid) for oid in spec.pg_type_oids])
+                                text_cols = [i for i, oid in enumerate(spec.pg_type_oids) if oid in _TEXT_OIDS]
+                            batches = self._pipelined(self._iter_oracle_batches(cur, len(spec.columns)))
+                            if binary:
+                                encoded = ((batch, None) for batch in batches)
+                            else:
+                                # CSV encoding gets its own stage: fetch -> encode -> write
+                                # Double-buffered: one payload queued while the next is encoded;
+                                # the queued COPY writer already absorbs socket latency
+                                encoded = self._pipelined(self._encode_csv_batches(batches), depth=ENCODE_DEPTH)
+                            for batch, payload in encoded:
+                                if binary:
+                                    # Rows stream into COPY one by one, so a failure at row k leaves
+                                    # rows 0..k-1 (and maybe part of row k) sent: the batch can't be
+                                    # skipped, the error fails the table and its transaction rolls back
+                                    for row in batch:
+                                        cp.write_row(self._text_row(row, text_cols) if text_cols else row)
+                                    total_rows += len(batch)
+                                    continue
                                 try:
-                                    payload = self._rows_to_csv_bytes(batch)
-                                    cp.write(payload)
+                                    if isinstance(payload, Exception):
+                                        raise payload
+                                    # CSV payloads are fully encoded first: a bad batch sends nothing
+                                    # memoryview: chunk slices are zero-copy
+                                    cp.write(memoryview(payload))
                                     total_rows += len(batch)
+                                except RETRYABLE_ERRORS:
+                                    # Aborts the whole COPY; leave it to the table-level retry
+                                    raise
                                 except Exception as e:
                                     failed_batches += 1
                                     self._log_bad_batch(spec, batch, e)
@@ -150,20 +339,380 @@ class DataLoader:
 
         return {"status": "ok", "rows": total_rows, "failed_batches": failed_batches}
 
+    def _load_small_tables(self, specs: List[TableSpec]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load many small tables over one Oracle and one Postgres connection, in a single transaction:
+        each table is fetched with one fetchmany() and written with one INSERT ... SELECT FROM unnest()
+        of per-column arrays, cast to the target column types. A table that turns out to hold more
+        than SMALL_TABLE_ROWS rows (stale estimate) is skipped after reading SMALL_TABLE_ROWS + 1.
+
+        Args:
+            specs: Small TableSpecs, parents before children.
+
+        Returns:
+            Stats per loaded table. Tables that fail (rolled back to their savepoint) or exceed the
+            cap are left out, so the caller loads them through the regular COPY path.
+        """
+        stats: Dict[str, Dict[str, Any]] = {}
+        with self._oracle_conn() as oc, self._pg_conn() as pc, oc.cursor() as cur, pc.cursor() as pgc:
+            self._set_output_handlers(cur)
+            cur.arraysize = SMALL_TABLE_ROWS + 1
+            try:
+                pgc.execute("SET LOCAL synchronous_commit = off; SET CONSTRAINTS ALL DEFERRED;")
+                with pc.transaction():
+                    pgc.execute("SET LOCAL session_replication_role = 'replica';")
+            except Exception:
+                pass
+            for spec in specs:
+                try:
+                    cur.execute(self._oracle_select(spec), fetch_lobs=False)
+                    # NUM_ROWS can be stale: read one row past the cap rather than the whole table
+                    rows = cur.fetchmany(SMALL_TABLE_ROWS + 1)
+                    if len(rows) > SMALL_TABLE_ROWS:
+                        sys.stderr.write(f"[WARN] {spec.name} has more than {SMALL_TABLE_ROWS} rows, loading it with COPY\n")
+                        continue
+                    if rows:
+                        target = spec.name.lower()
+                        target_cols = [c.lower() for c in spec.columns]
+                        with pc.transaction():
+                            types = self._pg_column_type_names(pgc, spec.pg_schema, target, target_cols)
+                            pgc.execute(
+                                sql.SQL("INSERT INTO {}.{} ({}) SELECT * FROM unnest({})").format(
+                                    sql.Identifier(spec.pg_schema),
+                                    sql.Identifier(target),
+                                    sql.SQL(",").join(sql.Identifier(c) for c in target_cols),
+                                    sql.SQL(", ").join(sql.SQL("%s::{}[]").format(sql.SQL(t)) for t in types),
+                                ),
+                                [list(col) for col in zip(*rows)],
+                            )
+                    stats[spec.name] = {"status": "ok", "rows": len(rows), "failed_batches": 0}
+                except Exception as e:
+                    sys.stderr.write(f"[WARN] Small-table insert failed for {spec.name}, retrying with COPY: {e!r}\n")
+        return stats
+
+    def _load_table_arrow(self, spec: TableSpec) -> Dict[str, Any]:
+        """
+        Loads single table through Arrow: Oracle DataFrame batches are ingested with ADBC,
+        which issues a binary COPY, so no per-cell Python objects are created.
+
+        Args:
+            spec: TableSpec describing owner, table, columns, and target schema.
+
+        Returns:
+            Stats dict: {'status': 'ok', 'rows': int, 'failed_batches': int}.
+
+        Notes:
+            Needs pyarrow and adbc-driver-postgresql; `pg.dsn` must be a postgresql:// URI.
+            Batches are cast to the target table's Arrow schema before ingest. Any cast or ingest
+            error raises before the final commit and leaves nothing behind (the caller falls back
+            to binary COPY).
+        """
+        total_rows = 0
+
+        ora_sql = self._prepare_spec(spec)[0]
+        target_cols = [c.lower() for c in spec.columns]
+
+        with self._oracle_conn() as oc, adbc_pg.connect(self.pg.dsn) as ac:
+            table_schema = ac.adbc_get_table_schema(spec.name.lower(), db_schema_filter=spec.pg_schema)
+            target_schema = pyarrow.schema([table_schema.field(c) for c in target_cols])
+            with ac.cursor() as acur:
+                for odf in oc.fetch_df_batches(ora_sql, size=self.pg.copy_batch_rows):
+                    batch = pyarrow.table(odf).rename_columns(target_cols).cast(target_schema)
+                    # No per-batch recovery: a failed ingest aborts the transaction, so any error
+                    # propagates and the uncommitted load is rolled back when the connection closes
+                    acur.adbc_ingest(spec.name.lower(), batch, mode="append", db_schema_name=spec.pg_schema)
+                    total_rows += batch.num_rows
+            ac.commit()
+
+        return {"status": "ok", "rows": total_rows, "failed_batches": 0}
+
+    def load_table_parallel(self, spec: TableSpec, n: int) -> Dict[str, Any]:
+        """ Loads one table through `n` concurrent COPY sessions, each reading one ROWID range
+        (see _split_rowid_ranges), or an ORA_HASH(ROWID) shard if the ranges can't be computed.
+
+        Args:
+            spec: TableSpec describing owner, table, columns, and target schema.
+            n: Number of shards / concurrent sessions.
+
+        Returns:
+            Combined stats dict: {'status', 'rows', 'failed_batches', 'shards'}; 'errors' lists failed shards.
+        """
+        copy_stmt = self._prepare_spec(spec)[1]
+        if self._copy_format() == "binary" and spec.pg_type_oids is None:
+            # Look up once here rather than racing in every shard
+            with self._pg_conn() as pc, pc.cursor() as pgc:
+                spec.pg_type_oids = self._pg_column_types(
+                    pgc, spec.pg_schema, spec.name.lower(), [c.lower() for c in spec.columns]
+                )
+
+        # ROWID ranges let each session read only its part of the table; hash shards each scan all of it
+        ranges = self._split_rowid_ranges(spec, n)
+        if ranges:
+            conds = [f"ROWID BETWEEN CHARTOROWID('{lo}') AND CHARTOROWID('{hi}')" for lo, hi in ranges]
+        else:
+            conds = [f"ORA_HASH(ROWID, {n - 1}) = {k}" for k in range(n)]
+        n = len(conds)
+
+        shards = []
+        for cond in conds:
+            where = f"({spec.where_clause}) AND {cond}" if spec.where_clause else cond
+            shard = replace(spec, where_clause=where)
+            # Shards differ only in their WHERE clause; share the compiled COPY statement
+            shard._compiled = (self._oracle_select(shard, utc=True), copy_stmt)
+            shards.append(shard)
+
+        rows = failed_batches = 0
+        errors: List[str] = []
+        with self._fast_load(spec), ThreadPoolExecutor(max_workers=n) as ex:
+            for fut in as_completed([ex.submit(with_retry, self._copy_table, shard) for shard in shards]):
+                try:
+                    res = fut.result()
+                    rows += res["rows"]
+                    failed_batches += res["failed_batches"]
+                except Exception as e:
+                    errors.append(repr(e))
+
+        out: Dict[str, Any] = {"status": "error" if errors else "ok", "rows": rows, "failed_batches": failed_batches, "shards": n}
+        if errors:
+            out["error"] = "; ".join(errors)
+        return out
+
+    def _split_rowid_ranges(self, spec: TableSpec, n: int) -> List[Tuple[str, str]]:
+        """
+        Split a table into at most `n` ROWID ranges of about equal size, built from its extents
+        (DBA_EXTENTS + DBMS_ROWID.ROWID_CREATE) so no pass over the table's rows is needed.
+
+        Args:
+            spec: TableSpec of the table to split (its where_clause is applied by each shard).
+            n: Number of ranges wanted.
+
+        Returns:
+            List of (low, high) ROWID strings, inclusive; empty if the extents can't be read.
+        """
+        try:
+            with self._oracle_conn() as oc, oc.cursor() as cur:
+                cur.execute(ROWID_EXTENTS_SQL, owner=spec.owner.upper(), name=spec.name)
+                extents = cur.fetchall()
+        except Exception as e:
+            sys.stderr.write(f"[WARN] ROWID range split failed for {spec.name}, using hash shards: {e!r}\n")
+            return []
+        if not extents:
+            return []
+
+        # Extents come back in ROWID order; cut them into runs of about total/n blocks each
+        target = sum(blocks for _, _, blocks in extents) / n
+        ranges: List[Tuple[str, str]] = []
+        lo, acc = None, 0
+        for first, last, blocks in extents:
+            if lo is None:
+                lo = first
+            acc += blocks
+            if acc >= target * (len(ranges) + 1) and len(ranges) < n - 1:
+                ranges.append((lo, last))
+                lo = None
+        if lo is not None:
+            ranges.append((lo, extents[-1][1]))
+        return ranges
+
+    # Fast-load helpers
+
+    @contextmanager
+    def _fast_load(self, spec: TableSpec) -> Iterator[None]:
+        """
+        Wrap a table load in the UNLOGGED / dropped-index pattern when `OutputCfg.fast_load` is set.
+        The table is always restored, also when the load fails.
+        """
+        if not getattr(self.out, "fast_load", False):
+            yield
+            return
+        with self._pg_conn() as pc, pc.cursor() as pgc:
+            index_defs = self._prepare_table(spec, pgc)
+        try:
+            yield
+        finally:
+            self._restore_table(spec, index_defs)
+
+    def _prepare_table(self, spec: TableSpec, pgc: psycopg.Cursor) -> List[str]:
+        """
+        Drop the target's secondary indexes and switch it to UNLOGGED before COPY.
+
+        Args:
+            spec: TableSpec of the target table.
+            pgc: Postgres cursor; each step runs in its own savepoint.
+
+        Returns:
+            CREATE INDEX statements (pg_get_indexdef) of the dropped indexes.
+
+        Notes:
+            Indexes backing constraints (PK/unique) stay. SET UNLOGGED is skipped when Postgres
+            refuses it, e.g. for tables referenced by or referencing logged tables through FKs.
+        """
+        table = sql.SQL("{}.{}").format(sql.Identifier(spec.pg_schema), sql.Identifier(spec.name.lower()))
+        pgc.execute(
+            "SELECT n.nspname, c.relname, pg_get_indexdef(i.indexrelid) "
+            "FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE i.indrelid = %s::regclass "
+            "AND NOT EXISTS (SELECT 1 FROM pg_constraint k WHERE k.conindid = i.indexrelid)",
+            (table.as_string(pgc),),
+        )
+        index_defs: List[str] = []
+        conn = pgc.connection
+        for nsp, name, ddl in pgc.fetchall():
+            try:
+                with conn.transaction():
+                    pgc.execute(sql.SQL("DROP INDEX {}.{}").format(sql.Identifier(nsp), sql.Identifier(name)))
+                index_defs.append(ddl)
+            except Exception as e:
+                sys.stderr.write(f"[WARN] Could not drop index {name} before load: {e!r}\n")
+        try:
+            with conn.transaction():
+                pgc.execute(sql.SQL("ALTER TABLE {} SET UNLOGGED").format(table))
+        except Exception as e:
+            sys.stderr.write(f"[WARN] {spec.name} stays logged during load: {e!r}\n")
+        return index_defs
+
+    def _truncate_for_freeze(self, spec: TableSpec, pgc: psycopg.Cursor) -> bool:
+        """
+        TRUNCATE the target inside the current transaction when it is empty, which makes
+        COPY ... FREEZE legal for it. Returns False (nothing changed) when the table has rows
+        or Postgres refuses, e.g. for tables referenced by foreign keys.
+        """
+        table = sql.SQL("{}.{}").format(sql.Identifier(spec.pg_schema), sql.Identifier(spec.name.lower()))
+        try:
+            with pgc.connection.transaction():
+                pgc.execute(sql.SQL("SELECT 1 FROM {} LIMIT 1").format(table))
+                if pgc.fetchone() is not None:
+                    return False
+                pgc.execute(sql.SQL("TRUNCATE {}").format(table))
+            return True
+        except Exception:
+            return False
+
+    def _restore_table(self, spec: TableSpec, index_defs: List[str]) -> None:
+        """
+        Switch the target back to LOGGED, then rebuild the dropped indexes, one session per index.
+        SET LOGGED comes first because it rewrites the table together with any existing indexes.
+        """
+        table = sql.SQL("{}.{}").format(sql.Identifier(spec.pg_schema), sql.Identifier(spec.name.lower()))
+        with self._pg_conn() as pc, pc.cursor() as pgc:
+            pgc.execute(
+                "SELECT relpersistence FROM pg_class WHERE oid = %s::regclass", (table.as_string(pgc),)
+            )
+            row = pgc.fetchone()
+            if row and row[0] == "u":
+                pgc.execute(sql.SQL("ALTER TABLE {} SET LOGGED").format(table))
+
+        def create(ddl: str) -> None:
+            with self._pg_conn() as pc:
+                # Sort memory for the index build, scoped to this transaction
+                pc.execute("SET LOCAL maintenance_work_mem = '1GB'")
+                pc.execute(ddl)
+
+        if not index_defs:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(len(index_defs), self.pg.copy_parallelism))) as ex:
+            for fut in as_completed([ex.submit(create, ddl) for ddl in index_defs]):
+                try:
+                    fut.result()
+                except Exception as e:
+                    sys.stderr.write(f"[WARN] Could not re-create index on {spec.name}: {e!r}\n")
+
+    # Scheduling helpers
+
+    def _copy_format(self) -> str:
+        """ Effective COPY format: 'binary', 'csv' or 'arrow' ('arrow' needs pyarrow + ADBC, else 'binary'). """
+        fmt = self.pg.copy_format.lower()
+        if fmt == "arrow" and adbc_pg is None:
+            return "binary"
+        return fmt
+
+    def _shard_count(self, spec: TableSpec) -> int:
+        """ Number of concurrent COPY sessions for a table, from its row estimate and `shard_rows`. """
+        if not spec.estimated_rows or self.pg.copy_parallelism <= 1:
+            return 1
+        return max(1, min(self.pg.copy_parallelism, math.ceil(spec.estimated_rows / self.pg.shard_rows)))
+
+    def _fk_waves(self, tables: List[TableSpec], fks: List[Dict]) -> List[List[TableSpec]]:
+        """
+        Group tables into load waves so FK-referenced parents come before their children.
+
+        Args:
+            tables: TableSpecs to schedule.
+            fks: Foreign key dicts with 'table_name' and 'r_table_name' (Oracle names).
+
+        Returns:
+            List of waves; tables within a wave are independent. Tables caught in an FK
+            cycle are placed together in the final wave.
+        """
+        parents: Dict[str, set] = {spec.name.lower(): set() for spec in tables}
+        for fk in fks:
+            child, parent = fk["table_name"].lower(), fk["r_table_name"].lower()
+            if child in parents and parent in parents and parent != child:
+                parents[child].add(parent)
+
+        waves: List[List[TableSpec]] = []
+        done: set = set()
+        pending = list(tables)
+        while pending:
+            wave = [spec for spec in pending if parents[spec.name.lower()] <= done]
+            if not wave:
+                # FK cycle: nothing left is free, load the rest together
+                wave = pending
+            waves.append(wave)
+            done.update(spec.name.lower() for spec in wave)
+            pending = [spec for spec in pending if spec.name.lower() not in done]
+        return waves
+
+    # Statement helpers
+
+    def _prepare_spec(self, spec: TableSpec) -> Tuple[str, sql.Composed]:
+        """
+        Build (once per TableSpec) the Oracle SELECT and the COPY statement for a table.
+
+        Args:
+            spec: TableSpec to compile; the result is cached on `spec._compiled`.
+
+        Returns:
+            Tuple of (Oracle SELECT text, COPY sql.Composed) targeting lowercase Postgres identifiers.
+        """
+        if spec._compiled is None:
+            spec._compiled = (self._oracle_select(spec, utc=True), self._copy_statement(spec))
+        return spec._compiled
+
+    def _copy_statement(self, spec: TableSpec, freeze: bool = False) -> sql.Composed:
+        """ COPY ... FROM STDIN for the spec's target columns, in the effective format; `freeze` adds FREEZE. """
+        template = COPY_CSV if self._copy_format() == "csv" else COPY_BINARY
+        return sql.SQL(template).format(
+            sql.Identifier(spec.pg_schema),
+            sql.Identifier(spec.name.lower()),
+            sql.SQL(',').join(sql.Identifier(c.lower()) for c in spec.columns),
+            sql.SQL(", FREEZE" if freeze else ""),
+        )
+
     # Oracle helpers
 
-    def _oracle_select(self, spec: TableSpec) -> str:
+    def _oracle_select(self, spec: TableSpec, utc: bool = False) -> str:
         """
-        Build a minimal Oracle SELECT for the given table and columns.
+        Oracle SELECT for the given table: the pre-quoted TableSpec base plus optional WHERE.
 
         Args:
             spec: TableSpec with owner, table name, columns, and optional where clause.
+            utc: Select columns bound for timestamptz (per `pg_type_oids`) as UTC, for binary COPY.
 
         Returns:
             SQL text like: SELECT c1, c2 FROM "OWNER"."TABLE" [WHERE <where_clause>]
         """
-        cols = ", ".join(self._quote_ora_ident(c) for c in spec.columns)
-        base = f"SELECT {cols} FROM {self._quote_ora_ident(spec.owner)}.{self._quote_ora_ident(spec.name)}"
+        base = spec._ora_select
+        if utc and spec.pg_type_oids and TIMESTAMPTZ_OID in spec.pg_type_oids:
+            # Binary COPY sends timestamptz values as naive UTC (see _BINARY_DUMP_OIDS); DATE and
+            # plain TIMESTAMP sources are taken in the Oracle session time zone by the CAST
+            cols = ", ".join(
+                f'SYS_EXTRACT_UTC(CAST("{c}" AS TIMESTAMP WITH TIME ZONE))' if oid == TIMESTAMPTZ_OID else f'"{c}"'
+                for c, oid in zip(spec.columns, spec.pg_type_oids)
+            )
+            base = f"SELECT {cols} FROM {spec._ora_from}"
         if spec.where_clause:
             return base + " WHERE " + spec.where_clause
         return base
@@ -179,67 +728,154 @@ class DataLoader:
         Notes:
             Caller is responsible for creating cursors and closing is handled by the context.
         """
-        conn = oracledb.connect(user=self.ora.user, password=self.ora.password, dsn=self.ora.dsn)
+        conn = self._ora_pool().acquire()
         try:
-            # Speeding up connections
-            conn.stmtcachesize = 50
             yield conn
         finally:
             try:
-                # Gracefully closing connections at the end of copying
+                # Releases the session back to the pool
                 conn.close()
             except Exception:
                 pass
 
+    def _ora_pool(self) -> oracledb.ConnectionPool:
+        """
+        Oracle session pool for this process, created on first use and shared by later loads.
+        Sized for `copy_parallelism` concurrent shard sessions.
+        """
+        return pools.ora_pool(self.ora.user, self.ora.password, self.ora.dsn, self.pg.copy_parallelism * 2)
+
 
     def _set_output_handlers(self, cur: oracledb.Cursor) -> None:
         """
-        Install an outputtypehandler on the given cursor so that LOBs are fetched
-        as Python-native types (str for CLOB/NCLOB, bytes for BLOB/RAW).
+        Install an outputtypehandler so non-integer NUMBERs are fetched as Decimal.
+        Binary COPY has no float -> numeric conversion, and Decimal keeps full precision.
+        LOBs need no handler: the SELECT runs with fetch_lobs=False.
 
         Args:
             cur: Oracle cursor to configure.
         """
         def handler(cursor, name, default_type, size, precision, scale):
-            if default_type in (oracledb.DB_TYPE_CLOB, oracledb.DB_TYPE_NCLOB):
-                return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
-            if default_type in (oracledb.DB_TYPE_BLOB, oracledb.DB_TYPE_LONG_RAW, oracledb.DB_TYPE_RAW):
-                return cursor.var(oracledb.DB_TYPE_LONG_RAW, arraysize=cursor.arraysize)
+            if default_type == oracledb.DB_TYPE_NUMBER and not (precision and scale == 0):
+                return cursor.var(decimal.Decimal, arraysize=cursor.arraysize)
         cur.outputtypehandler = handler
 
+    def _fetch_arraysize(self, cur: oracledb.Cursor) -> int:
+        """
+        Size Oracle fetches by row width: TARGET_FETCH_BYTES / estimated row bytes,
+        clamped to [MIN_ARRAYSIZE, OracleCfg.arraysize].
+
+        Args:
+            cur: Executed Oracle cursor; widths come from description display sizes (LOBs guessed).
+
+        Returns:
+            Effective arraysize for the remaining fetches.
+        """
+        if not cur.description:
+            return self.ora.arraysize
+        row_bytes = sum(d[2] or LOB_WIDTH_GUESS for d in cur.description) or 1
+        return max(min(MIN_ARRAYSIZE, self.ora.arraysize), min(self.ora.arraysize, TARGET_FETCH_BYTES // row_bytes))
+
     def _iter_oracle_batches(
         self,
         cur: oracledb.Cursor,
         ncols: int,
     ) -> Iterator[List[Tuple[Any, ...]]]:
         """
-        Yield lists of rows from the Oracle cursor, respecting `copy_batch_rows`. Defensively
-        protects against truncated rows or rows that are too long, which could break the copying and cause
-        data anamolaies during the migration.
+        Yield lists of rows from the Oracle cursor via fetchmany(), respecting `copy_batch_rows`
+        and the cursor's width-based arraysize.
+        The column count is checked once against the cursor description instead of per row,
+        since a mismatch would break the copying and cause data anomalies during the migration.
 
         Args:
             cur: Executed Oracle cursor (already .execute()'d).
-            ncols: Expected number of columns in each row (defensive padding/truncation).
+            ncols: Expected number of columns in each row.
 
         Yields:
             Lists (batches) of tuples representing rows.
+
+        Raises:
+            ValueError: If the cursor returns a different number of columns than expected.
         """
-        batch: List[Tuple[Any, ...]] = []
-        for row in cur:
-            if not isinstance(row, tuple):
-                row = tuple(row)
-            if len(row) != ncols:
-                # Defensive padding/truncation
-                row = tuple(row[:ncols]) + (None,) * max(0, ncols - len(row))
-            batch.append(row)
-            if len(batch) >= self.pg.copy_batch_rows:
-                yield batch
-                batch = []
-        if batch:
+        if cur.description is not None and len(cur.description) != ncols:
+            raise ValueError(f"Oracle query returned {len(cur.description)} columns, expected {ncols}")
+        while True:
+            batch = cur.fetchmany(min(self.pg.copy_batch_rows, cur.arraysize))
+            if not batch:
+                break
             yield batch
 
+    def _pipelined(self, batches: Iterator[Any], depth: int = PIPELINE_DEPTH) -> Iterator[Any]:
+        """
+        Run a batch iterator on a producer thread, handing batches over through a bounded queue
+        so the Oracle fetch and the Postgres COPY write overlap.
+
+        Args:
+            batches: Iterator of row batches (e.g. from `_iter_oracle_batches`).
+            depth: Queue size, i.e. how many items the producer may run ahead.
+
+        Yields:
+            The same batches, in order. Errors raised by the producer are re-raised here.
+        """
+        q: queue.Queue = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def put(item: Any) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for batch in batches:
+                    if not put(batch):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(_END)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = q.get()
+                if item is _END:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Unblock the producer if the consumer stopped early
+            stop.set()
+            producer.join()
+
     # CSV Serialisation
 
+    def _encode_csv_batches(
+        self,
+        batches: Iterator[List[Tuple[Any, ...]]],
+    ) -> Iterator[Tuple[List[Tuple[Any, ...]], Any]]:
+        """
+        Pair each batch with its CSV payload. Encoding errors are yielded in place of the
+        payload so the writer can log the bad batch and carry on with the next one.
+
+        Args:
+            batches: Iterator of row batches.
+
+        Yields:
+            (batch, payload bytes or the exception raised while encoding it).
+        """
+        for batch in batches:
+            try:
+                yield batch, self._rows_to_csv_bytes(batch)
+            except Exception as e:
+                yield batch, e
+
     def _rows_to_csv_bytes(self, rows: Sequence[Sequence[Any]]) -> bytes:
         """
         Convert a batch of rows to a UTF-8 CSV payload suitable for Postgres COPY.
@@ -249,6 +885,8 @@ class DataLoader:
             - Bytea values encoded as Postgres hex format: '\\xDEADBEEF'.
             - Timestamps/Date/Time use ISO-8601; parsed by Postgres text input.
             - Newlines are preserved; CSV quoting handles embedded delimiters.
+            - Cells are encoded a column at a time; rows with no delimiter/quote/newline inside a
+              field are joined directly and only the remaining rows go through csv.writer for quoting.
 
         Args:
             rows: Sequence of row sequences.
@@ -256,15 +894,92 @@ class DataLoader:
         Returns:
             Bytes ready to feed into psycopg COPY.write().
         """
-        buf = io.StringIO()
-        writer = csv.writer(
-            buf, lineterminator="\n", quoting=csv.QUOTE_MINIMAL, doublequote=True
-        )
-        for row in rows:
-            writer.writerow([self._to_csv_field(v) for v in row])
-        data = buf.getvalue().encode("utf-8", "strict")
-        buf.close()
-        return data
+        if not rows:
+            return b""
+        # Column-at-a-time encoding: one C-level map per column instead of per-cell dispatch
+        cols = [self._encode_csv_column(col) for col in zip(*rows)]
+        lines = list(map(",".join, zip(*cols)))
+        text = "\n".join(lines)
+        ncols = len(cols)
+        if (
+            ncols > 1
+            and '"' not in text
+            and "\r" not in text
+            and text.count("\n") == len(lines) - 1
+            and text.count(",") == len(lines) * (ncols - 1)
+        ):
+            # No field in the batch needs quoting
+            return (text + "\n").encode("utf-8", "strict")
+
+        buf, writer = self._csv_scratch()
+        out: List[str] = []
+        for line, cells in zip(lines, zip(*cols)):
+            if line and line.count(",") == ncols - 1 and '"' not in line and "\n" not in line and "\r" not in line:
+                out.append(line)
+            else:
+                # Needs quoting (or is a lone empty field): let csv.writer handle this row
+                writer.writerow(cells)
+                out.append(buf.getvalue()[:-1])
+                buf.seek(0)
+                buf.truncate()
+        out.append("")
+        return "\n".join(out).encode("utf-8", "strict")
+
+    def _csv_scratch(self) -> Tuple[io.StringIO, Any]:
+        """ This thread's reusable (StringIO, csv.writer) pair; the buffer is left empty between rows. """
+        scratch = getattr(_TLS, "csv", None)
+        if scratch is None:
+            buf = io.StringIO()
+            writer = csv.writer(
+                buf, lineterminator="\n", quoting=csv.QUOTE_MINIMAL, doublequote=True
+            )
+            scratch = _TLS.csv = (buf, writer)
+        return scratch
+
+    def _encode_csv_column(self, col: Tuple[Any, ...]) -> Sequence[str]:
+        """
+        Encode one column of a batch to CSV field strings.
+
+        Args:
+            col: Values of a single column, one per row.
+
+        Returns:
+            Field strings; the input itself when it is already all str.
+        """
+        kinds = set(map(type, col))
+        if kinds == {str}:
+            return col
+        none = type(None)
+        if none in kinds:
+            kinds.discard(none)
+            if kinds <= {str}:
+                return [NULL_SENTINEL if v is None else v for v in col]
+        elif len(kinds) == 1:
+            fn = _DISPATCH.get(kinds.pop())
+            if fn is not None:
+                return list(map(fn, col))
+        return list(map(self._to_csv_field, col))
+
+    def _text_row(self, row: Sequence[Any], text_cols: List[int]) -> Sequence[Any]:
+        """
+        Render non-str values bound for text-like columns as Postgres text input (as the CSV
+        path would), so binary COPY can dump them; rows that need nothing are returned as-is.
+
+        Args:
+            row: One Oracle row.
+            text_cols: Indexes of the columns whose target type is in _TEXT_OIDS.
+
+        Returns:
+            The row, or a list copy with those values converted by _to_csv_field.
+        """
+        out = None
+        for i in text_cols:
+            v = row[i]
+            if v is not None and not isinstance(v, str):
+                if out is None:
+                    out = list(row)
+                out[i] = self._to_csv_field(v)
+        return row if out is None else out
 
     def _to_csv_field(self, v: Any) -> str:
         """
@@ -278,6 +993,9 @@ class DataLoader:
         """
         if v is None:
             return NULL_SENTINEL
+        fn = _DISPATCH.get(type(v))
+        if fn is not None:
+            return fn(v)
         if isinstance(v, (int, float, decimal.Decimal)):
             return str(v)
         if isinstance(v, datetime.datetime):
@@ -285,7 +1003,7 @@ class DataLoader:
         if isinstance(v, (datetime.date, datetime.time)):
             return v.isoformat()
         if isinstance(v, (bytes, bytearray, memoryview)):
-            return "\\x" + bytes(v).hex()
+            return _hex(v)
 
         # Fallback to string if all else fails
         return str(v)
@@ -301,8 +1019,18 @@ class DataLoader:
             Open `psycopg.Connection` with autocommit disabled (caller commits per table).
 
         Notes:
-            Ensures connection is closed; caller handles cursor/COPY lifecycle.
+            Connections come from a per-process psycopg_pool when available (committed on
+            success, rolled back on error, then returned); otherwise a fresh connection is
+            opened and closed. Caller handles cursor/COPY lifecycle.
         """
+        pool = self._pg_pool()
+        if pool is not None:
+            with pool.connection() as conn:
+                # One explicit transaction per table load, committed on exit
+                conn.autocommit = False
+                yield conn
+            return
+
         conn = psycopg.connect(self.pg.dsn)
         try:
             yield conn
@@ -313,6 +1041,114 @@ class DataLoader:
             except Exception:
                 pass
 
+    def _checkpoint(self) -> None:
+        """
+        Flush the loaded data to disk once at the end of a run. Table loads commit with
+        synchronous_commit=off, so this restores durability. Best-effort: CHECKPOINT needs
+        superuser or pg_checkpoint.
+        """
+        try:
+            with self._pg_conn() as pc:
+                pc.autocommit = True
+                pc.execute("CHECKPOINT")
+        except Exception as e:
+            sys.stderr.write(f"[WARN] CHECKPOINT after load skipped: {e!r}\n")
+
+    def _pg_pool(self) -> Optional[Any]:
+        """ Postgres connection pool for this process, or None if psycopg_pool is not installed. """
+        return pools.pg_pool(self.pg.dsn, self.pg.copy_parallelism * 2)
+
+    def close(self) -> None:
+        """ Close the connection pools opened in the current process (see pools.close_pools). """
+        pools.close_pools()
+
+
+    def _pg_column_types(
+        self,
+        cur: psycopg.Cursor,
+        schema: str,
+        table: str,
+        columns: Sequence[str],
+    ) -> List[int]:
+        """
+        Look up the type OIDs of the target columns so binary COPY can pick matching dumpers.
+
+        Args:
+            cur: Open Postgres cursor.
+            schema: Target schema.
+            table: Target table (Postgres identifier).
+            columns: Target column names, in COPY order.
+
+        Returns:
+            Type OIDs aligned with `columns`.
+        """
+        regclass = sql.SQL("{}.{}").format(sql.Identifier(schema), sql.Identifier(table)).as_string(cur)
+        cur.execute(
+            "SELECT attname, atttypid FROM pg_attribute "
+            "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+            (regclass,),
+        )
+        oids = dict(cur.fetchall())
+        return [oids[c] for c in columns]
+
+    def _prefill_type_oids(self, tables: List[TableSpec]) -> None:
+        """
+        Fill `pg_type_oids` for all specs with one pg_attribute query per target schema, so
+        worker processes don't each look their table up before COPY. Best-effort: specs whose
+        table or columns are not found keep None and fall back to the per-table lookup.
+        """
+        pending: Dict[str, List[TableSpec]] = {}
+        for spec in tables:
+            if spec.pg_type_oids is None:
+                pending.setdefault(spec.pg_schema, []).append(spec)
+        if not pending:
+            return
+        try:
+            with self._pg_conn() as pc, pc.cursor() as cur:
+                for schema, specs in pending.items():
+                    cur.execute(
+                        "SELECT c.relname, a.attname, a.atttypid FROM pg_attribute a "
+                        "JOIN pg_class c ON c.oid = a.attrelid "
+                        "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                        "WHERE n.nspname = %s AND c.relname = ANY(%s) AND a.attnum > 0 AND NOT a.attisdropped",
+                        (schema, [spec.name.lower() for spec in specs]),
+                    )
+                    oids: Dict[Tuple[str, str], int] = {(t, c): oid for t, c, oid in cur.fetchall()}
+                    for spec in specs:
+                        table = spec.name.lower()
+                        keys = [(table, c.lower()) for c in spec.columns]
+                        if all(k in oids for k in keys):
+                            spec.pg_type_oids = [oids[k] for k in keys]
+        except Exception as e:
+            sys.stderr.write(f"[WARN] Bulk type OID lookup failed, falling back per table: {e!r}\n")
+
+    def _pg_column_type_names(
+        self,
+        cur: psycopg.Cursor,
+        schema: str,
+        table: str,
+        columns: Sequence[str],
+    ) -> List[str]:
+        """
+        Look up the SQL type names (format_type, with typmods) of the target columns.
+
+        Args:
+            cur: Open Postgres cursor.
+            schema: Target schema.
+            table: Target table (Postgres identifier).
+            columns: Target column names, in insert order.
+
+        Returns:
+            Type names aligned with `columns`, e.g. ['integer', 'character varying(30)'].
+        """
+        regclass = sql.SQL("{}.{}").format(sql.Identifier(schema), sql.Identifier(table)).as_string(cur)
+        cur.execute(
+            "SELECT attname, format_type(atttypid, atttypmod) FROM pg_attribute "
+            "WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped",
+            (regclass,),
+        )
+        types = dict(cur.fetchall())
+        return [types[c] for c in columns]
 
     def _quote_ident(self, name: str) -> str:
         """
@@ -331,7 +1167,7 @@ class DataLoader:
 
     def _quote_ora_ident(self, name: str) -> str:
         """
-        Quote an Oracle identifier for SELECT statements.
+        Quote a user-supplied Oracle identifier (dictionary names are pre-quoted on TableSpec).
 
         Args:
             name: Oracle owner/table/column identifier.
@@ -365,6 +1201,7 @@ class DataLoader:
         """
         try:
             out = Path(out_dir) if out_dir else self.out_dir
+            out.mkdir(parents=True, exist_ok=True)
             h = hashlib.sha1((repr(err) + spec.name + str(len(rows))).encode("utf-8")).hexdigest()[:10]
             path = out / f"badbatch_{spec.name}_{h}.csv"
             with open(path, "wb") as f:
@@ -373,4 +1210,17 @@ class DataLoader:
             return path
         except Exception:
             # best-effort logging only
-            return None
\ No newline at end of file
+            return None
+
+# Process pool workers
+
+_WORKER: Optional[DataLoader] = None
+
+def _init_worker(ora: OracleCfg, pg: PostgresCfg, out: OutputCfg) -> None:
+    """ ProcessPoolExecutor initializer: one DataLoader per worker process. """
+    global _WORKER
+    _WORKER = DataLoader(ora, pg, out)
+
+def _worker_load_table(spec: TableSpec) -> Dict[str, Any]:
+    """ Load one table on this worker's DataLoader (see _init_worker). """
+    return _WORKER.load_table(spec)
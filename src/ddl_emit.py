@@ -1,17 +1,27 @@
+import io
 import re
 import hashlib
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import IO, Dict, Iterable, Iterator, List, Tuple, Optional
 
 from type_map import map_type as map_type
 
 PG_MAX_IDENT = 63
 _NEEDS_QUOTE = re.compile(r'[^a-z0-9_]|^[^a-z_]|^[0-9]')
-_RESERVED = {
+_UNSAFE_CHARS = re.compile(r'[^a-z0-9_]')
+_IDENT_START = frozenset('abcdefghijklmnopqrstuvwxyz_')
+# _column_def sanitizers for mapper output
+_RE_NONE_PARENS = re.compile(r'\(\s*None\s*(?:,\s*None\s*)?\)', re.I)
+_RE_EMPTY_PARENS = re.compile(r'\(\s*\)$')
+_BAD_TYPES = frozenset({"ctid"})
+_RESERVED = frozenset({
     "offset", "limit", "user", "schema", "table", "column", "order", "group",
     "primary", "foreign", "unique", "constraint", "references", "timestamp",
     "type", "name", "value", "values"
-}
+})
 BIGINT_MAX = 9223372036854775807
+# Tokens that open a quoted/comment region or end a statement
+_STMT_TOKENS = re.compile(r"""'|"|--|/\*|\$[A-Za-z_]*\$|;""")
 
 class NameMapper:
     """
@@ -24,48 +34,85 @@ class NameMapper:
     """
     def __init__(self):
         self.map: Dict[str, str] = {}
+        # Reverse of self.map. Keys and values are the same str objects as in self.map,
+        # so this costs only dict slots, no second copy of the names.
         self.used: Dict[str, str] = {}
+        # normalized base -> next suffix to try, so repeated collisions don't rescan _1.._k
+        self._base_count: Dict[str, int] = {}
+        # original -> quoted pg identifier, the form every DDL emitter actually needs
+        self._qmap: Dict[str, str] = {}
+        # ident -> quote(ident)
+        self._quoted: Dict[str, str] = {}
 
     def _normalize(self, name: str) -> str:
         n = (name or "").strip().lower()
-        n = re.sub(r'[^a-z0-9_]', '_', n)
-        if not n or not re.match(r'[a-z_]', n[0]):
+        # Common case: already a plain ASCII identifier, no regex needed
+        if n.isascii() and n.isidentifier():
+            return n
+        n = _UNSAFE_CHARS.sub('_', n)
+        if not n or n[0] not in _IDENT_START:
             n = f"_{n}"
         return n
 
     def _shorten(self, n: str) -> str:
-        if len(n) <= PG_MAX_IDENT:
-            return n
-        h = hashlib.blake2b(n.encode('utf-8'), digest_size=4).hexdigest()  # 8 chars
-        keep = PG_MAX_IDENT - 1 - len(h)
-        return f"{n[:keep]}_{h}"
+        return _shorten_ident(n)
 
     def pg_ident(self, original: str) -> str:
         if original in self.map:
             return self.map[original]
         n = self._shorten(self._normalize(original))
         base = n
-        i = 1
-        while n in self.used and self.used[n] != original:
-            suffix = f"_{i}"
-            n = self._shorten(base[: max(0, PG_MAX_IDENT - len(suffix))] + suffix)
-            i += 1
+        if n in self.used and self.used[n] != original:
+            # suffixes below the saved counter are already taken (self.used only grows)
+            i = self._base_count.get(base, 1)
+            while n in self.used and self.used[n] != original:
+                suffix = f"_{i}"
+                n = self._shorten(base[: max(0, PG_MAX_IDENT - len(suffix))] + suffix)
+                i += 1
+            self._base_count[base] = i
         self.map[original] = n
         self.used[n] = original
         return n
 
+    def qident(self, original: str) -> str:
+        """quote(pg_ident(original)), memoized per original name."""
+        q = self._qmap.get(original)
+        if q is None:
+            q = self._qmap[original] = self.quote(self.pg_ident(original))
+        return q
+
     def quote(self, ident: str) -> str:
+        q = self._quoted.get(ident)
+        if q is not None:
+            return q
         if not ident:
-            return '""'
-        needs = _NEEDS_QUOTE.search(ident) or (ident.lower() in _RESERVED)
-        if needs:
-            return f'"{ident.replace(chr(34), chr(34)*2)}"'
-        return ident
+            q = '""'
+        elif _NEEDS_QUOTE.search(ident) or ident.lower() in _RESERVED:
+            q = '"' + ident.replace('"', '""') + '"'
+        else:
+            q = ident
+        self._quoted[ident] = q
+        return q
+
+# Base hasher for _shorten_ident; copied per name instead of re-initialized. Unkeyed and
+# unpersonalized on purpose: suffixes must stay identical to names already emitted.
+_IDENT_HASHER = hashlib.blake2b(digest_size=4)
+
+@lru_cache(maxsize=None)
+def _shorten_ident(n: str) -> str:
+    """Truncate to PG_MAX_IDENT with a stable 8-hex blake2b suffix; pure, so memoized."""
+    if len(n) <= PG_MAX_IDENT:
+        return n
+    h = _IDENT_HASHER.copy()
+    h.update(n.encode('ascii') if n.isascii() else n.encode('utf-8'))
+    h = h.hexdigest()  # 8 chars
+    keep = PG_MAX_IDENT - 1 - len(h)
+    return f"{n[:keep]}_{h}"
 
 def _table_ident(nm: NameMapper, table_name: str, schema: Optional[str]) -> str:
-    t = nm.quote(nm.pg_ident(table_name))
+    t = nm.qident(table_name)
     if schema:
-        s = nm.quote(nm.pg_ident(schema))
+        s = nm.qident(schema)
         return f"{s}.{t}"
     return t
 
@@ -80,7 +127,7 @@ def _column_def(nm: NameMapper, col: Dict) -> str:
       - data_default (optional raw default string, already PG-friendly if possible)
       - pg_type (optional explicit override)
     """
-    name = nm.quote(nm.pg_ident(col["column_name"]))
+    name = nm.qident(col["column_name"])
     pg_type = col.get("pg_type")
     if not pg_type:
         pg_type = map_type(
@@ -92,12 +139,13 @@ def _column_def(nm: NameMapper, col: Dict) -> str:
     # --- sanitize problematic mapper outputs (prototype-friendly) ---
     if isinstance(pg_type, str):
         # convert 'ctid' (not a type) to 'text'
-        if pg_type.strip().lower() == "ctid":
+        if pg_type.strip().lower() in _BAD_TYPES:
             pg_type = "text"
-        # drop '(None, ...)' or '(None)' patterns e.g. numeric(None), numeric(None,0)
-        pg_type = re.sub(r'\(\s*None\s*(?:,\s*None\s*)?\)', '', pg_type, flags=re.I)
-        # remove stray empty parentheses 'numeric()' -> 'numeric'
-        pg_type = re.sub(r'\(\s*\)$', '', pg_type)
+        elif "(" in pg_type:
+            # drop '(None, ...)' or '(None)' patterns e.g. numeric(None), numeric(None,0)
+            pg_type = _RE_NONE_PARENS.sub('', pg_type)
+            # remove stray empty parentheses 'numeric()' -> 'numeric'
+            pg_type = _RE_EMPTY_PARENS.sub('', pg_type)
 
     parts = [name, pg_type]
     dflt = col.get("data_default")
@@ -126,7 +174,7 @@ def emit_create_table(
 
     lines = [_column_def(nm, c) for c in columns]
     if pkeys:
-        pk_cols = ", ".join(nm.quote(nm.pg_ident(c)) for c in pkeys)
+        pk_cols = ", ".join(nm.qident(c) for c in pkeys)
         lines.append(f"PRIMARY KEY ({pk_cols})")
 
     body = ",\n  ".join(lines) if lines else ""
@@ -145,25 +193,25 @@ def emit_constraints(
         'constraint_name','table_name','columns',
         'r_table_name','r_columns','delete_rule' (NO ACTION/CASCADE/SET NULL)
     """
-    nm = namemap or NameMapper()
-    stmts: List[str] = []
+    return list(_iter_constraints(fks, schema, namemap or NameMapper(), deferrable))
+
+def _iter_constraints(fks: Iterable[Dict], schema: Optional[str], nm: NameMapper, deferrable: bool) -> Iterator[str]:
     for fk in fks:
         tbl = _table_ident(nm, fk["table_name"], schema)
         rtbl = _table_ident(nm, fk["r_table_name"], schema)
-        cname = nm.quote(nm.pg_ident(fk["constraint_name"]))
-        cols = ", ".join(nm.quote(nm.pg_ident(c)) for c in fk["columns"])
-        rcols = ", ".join(nm.quote(nm.pg_ident(c)) for c in fk["r_columns"])
+        cname = nm.qident(fk["constraint_name"])
+        cols = ", ".join(nm.qident(c) for c in fk["columns"])
+        rcols = ", ".join(nm.qident(c) for c in fk["r_columns"])
         suffix = ""
         dr = (fk.get("delete_rule") or "NO ACTION").upper()
         if dr != "NO ACTION":
             suffix += f" ON DELETE {dr}"
         if deferrable:
             suffix += " DEFERRABLE INITIALLY DEFERRED"
-        stmts.append(
+        yield (
             f"ALTER TABLE {tbl} ADD CONSTRAINT {cname} "
             f"FOREIGN KEY ({cols}) REFERENCES {rtbl} ({rcols}){suffix};"
         )
-    return stmts
 
 def emit_indexes(
     index_defs: List[Dict],
@@ -174,15 +222,15 @@ def emit_indexes(
     Emit (UNIQUE) INDEX DDL.
       index_defs: [{'index_name','table_name','columns',[...],'uniqueness':'UNIQUE'|'NONUNIQUE'}]
     """
-    nm = namemap or NameMapper()
-    out: List[str] = []
+    return list(_iter_indexes(index_defs, schema, namemap or NameMapper()))
+
+def _iter_indexes(index_defs: Iterable[Dict], schema: Optional[str], nm: NameMapper) -> Iterator[str]:
     for ix in index_defs:
-        ixname = nm.quote(nm.pg_ident(ix["index_name"]))
+        ixname = nm.qident(ix["index_name"])
         tbl = _table_ident(nm, ix["table_name"], schema)
-        cols = ", ".join(nm.quote(nm.pg_ident(c)) for c in ix.get("columns", []))
+        cols = ", ".join(nm.qident(c) for c in ix.get("columns", []))
         uniq = "UNIQUE " if ix.get("uniqueness") == "UNIQUE" else ""
-        out.append(f"CREATE {uniq}INDEX IF NOT EXISTS {ixname} ON {tbl} ({cols});")
-    return out
+        yield f"CREATE {uniq}INDEX IF NOT EXISTS {ixname} ON {tbl} ({cols});"
 
 def emit_sequences(
     seq_defs: List[Dict],
@@ -195,12 +243,12 @@ def emit_sequences(
       - Force CACHE >= 1
       - Omit MAXVALUE if it exceeds BIGINT
     """
-    nm = namemap or NameMapper()
-    out: List[str] = []
+    return list(_iter_sequences(seq_defs, schema, namemap or NameMapper()))
 
+def _iter_sequences(seq_defs: Iterable[Dict], schema: Optional[str], nm: NameMapper) -> Iterator[str]:
     for s in seq_defs:
-        sname = nm.quote(nm.pg_ident(s["sequence_name"]))
-        fq = sname if not schema else f"{nm.quote(nm.pg_ident(schema))}.{sname}"
+        sname = nm.qident(s["sequence_name"])
+        fq = sname if not schema else f"{nm.qident(schema)}.{sname}"
         parts = [f"CREATE SEQUENCE IF NOT EXISTS {fq}"]
 
         inc = s.get("increment_by")
@@ -230,27 +278,93 @@ def emit_sequences(
 
         parts.append("CYCLE" if (s.get("cycle_flag") == "Y") else "NO CYCLE")
         # DO NOT emit ORDER/NO ORDER in PG
-        out.append(" ".join(parts) + ";")
-    return out
+        yield " ".join(parts) + ";"
 
 def compose_plan(
     schema: Optional[str],
     seq_defs: List[Dict],
-    tables: List[Tuple[Dict, List[Dict], Optional[List[str]]]],
+    tables: Iterable[Tuple[Dict, List[Dict], Optional[List[str]]]],
     fks: List[Dict],
     indexes: List[Dict],
-    namemap: Optional[NameMapper] = None
+    namemap: Optional[NameMapper] = None,
+    out: Optional[IO[str]] = None
 ) -> str:
     """
     Produce a single SQL string in deterministic order:
       sequences → tables (with inline PK) → FKs → indexes
-    tables: list of (table_def, columns, pkeys)
+    tables: iterable of (table_def, columns, pkeys); consumed once
+    out:    optional text stream; statements are written to it as they are
+            emitted (e.g. straight to a file) and "" is returned
+    """
+    buf = out if out is not None else io.StringIO()
+    sep = ""
+    for stmt in iter_plan(schema, seq_defs, tables, fks, indexes, namemap):
+        buf.write(sep)
+        buf.write(stmt)
+        sep = "\n"
+    return "" if out is not None else buf.getvalue()
+
+def iter_plan(
+    schema: Optional[str],
+    seq_defs: List[Dict],
+    tables: Iterable[Tuple[Dict, List[Dict], Optional[List[str]]]],
+    fks: List[Dict],
+    indexes: List[Dict],
+    namemap: Optional[NameMapper] = None
+) -> Iterator[str]:
+    """
+    Yield the compose_plan statements one at a time, in the same order,
+    so callers can write or execute them without holding the whole script.
     """
     nm = namemap or NameMapper()
-    parts: List[str] = []
-    parts += emit_sequences(seq_defs, schema, nm)
+    yield from _iter_sequences(seq_defs, schema, nm)
     for tdef, cols, pks in tables:
-        parts.append(emit_create_table(tdef, cols, pks, schema, nm))
-    parts += emit_constraints(fks, schema, nm)
-    parts += emit_indexes(indexes, schema, nm)
-    return "\n".join(parts)
\ No newline at end of file
+        yield emit_create_table(tdef, cols, pks, schema, nm)
+    yield from _iter_constraints(fks, schema, nm, True)
+    yield from _iter_indexes(indexes, schema, nm)
+
+def iter_statements(sql: str) -> Iterator[str]:
+    """
+    Split a SQL script into statements in a single pass.
+    Semicolons inside '...' literals, "..." identifiers, $tag$...$tag$ bodies
+    and -- / /* */ comments do not end a statement. Yields stripped statements
+    (terminating ';' included); empty statements are skipped.
+    """
+    n = len(sql)
+    start = pos = 0
+    while True:
+        m = _STMT_TOKENS.search(sql, pos)
+        if m is None:
+            break
+        tok, end = m.group(), m.end()
+        if tok == ";":
+            stmt = sql[start:end].strip()
+            if stmt != ";":
+                yield stmt
+            start = pos = end
+        elif tok in ("'", '"'):
+            # jump to the closing quote, skipping doubled '' / "" escapes
+            pos = end
+            while True:
+                j = sql.find(tok, pos)
+                if j < 0:
+                    pos = n
+                    break
+                if sql.startswith(tok, j + 1):
+                    pos = j + 2
+                    continue
+                pos = j + 1
+                break
+        elif tok == "--":
+            j = sql.find("\n", end)
+            pos = n if j < 0 else j + 1
+        elif tok == "/*":
+            j = sql.find("*/", end)
+            pos = n if j < 0 else j + 2
+        else:
+            # dollar-quoted body: $tag$ ... $tag$
+            j = sql.find(tok, end)
+            pos = n if j < 0 else j + len(tok)
+    tail = sql[start:].strip()
+    if tail:
+        yield tail
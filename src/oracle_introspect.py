@@ -1,10 +1,180 @@
 # oracle_introspect.py
 from __future__ import annotations
-from typing import Optional, Iterable, List, Dict, Tuple
+from typing import Optional, Iterable, Iterator, List, Dict, Tuple
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
+import asyncio
 import oracledb
 
 from config import OracleCfg
 
+# Tables per UNION ALL count query (as valid.COUNT_CHUNK_TABLES); keeps large selections under parser limits
+COUNT_CHUNK_TABLES = 200
+
+# Metadata queries, shared by the per-getter path and the pipelined fetch_all_metadata
+
+TABLES_SQL = """
+    SELECT table_name,
+            temporary,
+            num_rows,
+            avg_row_len
+    FROM all_tables
+    WHERE  owner = :owner
+    ORDER  BY table_name
+"""
+
+COLUMNS_SQL = """
+    SELECT table_name,
+           column_name,
+           data_type,
+           data_precision,
+           data_scale,
+           nullable,
+           data_default
+    FROM   all_tab_columns
+    WHERE  owner = :owner
+    ORDER  BY table_name, column_id
+"""
+
+PK_SQL = """
+    SELECT c.table_name,
+           c.constraint_name,
+           cc.column_name,
+           cc.position
+    FROM   all_constraints c
+    JOIN   all_cons_columns cc
+      ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
+    WHERE  c.owner = :owner
+      AND  c.constraint_type = 'P'
+    ORDER  BY c.table_name, c.constraint_name, cc.position
+"""
+
+FK_SQL = """
+    SELECT fk.constraint_name AS fk_name,
+           fk.table_name      AS fk_table,
+           fk.delete_rule,
+           fkc.column_name    AS fk_col,
+           fkc.position       AS pos,
+           pk.table_name      AS pk_table,
+           pkc.column_name    AS pk_col
+    FROM   all_constraints fk
+    JOIN   all_constraints pk
+      ON pk.owner = fk.r_owner
+     AND pk.constraint_name = fk.r_constraint_name
+    JOIN   all_cons_columns fkc
+      ON fkc.owner = fk.owner
+     AND fkc.constraint_name = fk.constraint_name
+    JOIN   all_cons_columns pkc
+      ON pkc.owner = pk.owner
+     AND pkc.constraint_name = pk.constraint_name
+     AND pkc.position = fkc.position
+    WHERE  fk.owner = :owner
+      AND  fk.constraint_type = 'R'
+    ORDER  BY fk.table_name, fk.constraint_name, fkc.position
+"""
+
+INDEXES_SQL = """
+    SELECT i.index_name,
+           i.table_name,
+           i.uniqueness,
+           ic.column_name,
+           ic.column_position
+    FROM   all_indexes i
+    LEFT   JOIN all_ind_columns ic
+      ON ic.index_owner = i.owner
+     AND ic.index_name = i.index_name
+    WHERE  i.owner = :owner
+    ORDER  BY i.table_name, i.index_name, ic.column_position
+"""
+
+SEQUENCES_SQL = """
+    SELECT sequence_name,
+           increment_by,
+           min_value,
+           max_value,
+           cache_size,
+           cycle_flag,
+           order_flag,
+           last_number
+    FROM   all_sequences
+    WHERE  sequence_owner = :owner
+    ORDER  BY sequence_name
+"""
+
+
+@lru_cache(maxsize=None)
+def _row_type(fields: Tuple[str, ...]):
+    """Namedtuple class for a result shape (lowercase column names), built once per shape."""
+    return namedtuple("Row", fields)
+
+def _shape_tables(
+    rows: Iterable[Dict],
+    include_tables: Optional[Iterable[str]] = None,
+    exclude_tables: Optional[Iterable[str]] = None,
+) -> List[Dict]:
+    rows = list(rows)
+    # prototype-friendly name filters (case-insensitive exact matches)
+    if include_tables:
+        want = {t.lower() for t in include_tables}
+        rows = [r for r in rows if r["table_name"].lower() in want]
+    if exclude_tables:
+        drop = {t.lower() for t in exclude_tables}
+        rows = [r for r in rows if r["table_name"].lower() not in drop]
+    # normalize NUM_ROWS / AVG_ROW_LEN (may be NULL if stats are stale/missing)
+    for r in rows:
+        if "num_rows" in r and r["num_rows"] is not None:
+            r["num_rows"] = int(r["num_rows"])
+        if r.get("avg_row_len") is not None:
+            r["avg_row_len"] = int(r["avg_row_len"])
+    return rows
+
+def _shape_columns(rows: Iterable[Dict]) -> List[Dict]:
+    out: List[Dict] = []
+    for r in rows:
+        r["nullable"] = (r.get("nullable") == "Y")
+        if isinstance(r.get("data_default"), str):
+            r["data_default"] = r["data_default"].strip()
+        out.append(r)
+    return out
+
+def _group_pk(rows: Iterable[Tuple]) -> List[Dict]:
+    # PK_SQL orders by table, constraint, position: each run is one key, columns already in order
+    return [
+        {"table_name": tbl, "constraint_name": cn, "columns": [r.column_name for r in grp]}
+        for (tbl, cn), grp in groupby(rows, key=attrgetter("table_name", "constraint_name"))
+    ]
+
+def _group_fk(rows: Iterable[Tuple]) -> List[Dict]:
+    # FK_SQL orders by table, constraint, position
+    out: List[Dict] = []
+    for (name, table), grp in groupby(rows, key=attrgetter("fk_name", "fk_table")):
+        grp = list(grp)
+        out.append({
+            "constraint_name": name,
+            "table_name": table,
+            "columns": [r.fk_col for r in grp],
+            "r_table_name": grp[-1].pk_table,
+            "r_columns": [r.pk_col for r in grp],
+            "delete_rule": grp[-1].delete_rule,
+        })
+    return out
+
+def _group_indexes(rows: Iterable[Tuple]) -> List[Dict]:
+    # INDEXES_SQL orders by table, index, position; an index without columns yields one NULL row
+    out: List[Dict] = []
+    for (tbl, name), grp in groupby(rows, key=attrgetter("table_name", "index_name")):
+        grp = list(grp)
+        out.append({
+            "index_name": name,
+            "table_name": tbl,
+            "uniqueness": grp[0].uniqueness,  # 'UNIQUE' / 'NONUNIQUE'
+            "columns": [r.column_name for r in grp if r.column_name is not None]
+        })
+    return out
+
 
 class OracleIntrospector:
     def __init__(self, cfg: OracleCfg):
@@ -17,15 +187,69 @@ class OracleIntrospector:
         self.conn = oracledb.connect(user=cfg.user, password=cfg.password, dsn=cfg.dsn)
         self.conn.stmtcachesize = 50
         self.arraysize = cfg.arraysize
+        # Prepared metadata cursors keyed by SQL text, reused across getter calls / owners
+        self._stmts: Dict[str, oracledb.Cursor] = {}
+        # Lowercased result column names per prepared cursor (fixed shape), keyed by id(cursor)
+        self._col_names: Dict[int, Tuple[str, ...]] = {}
+
+    def close(self) -> None:
+        for cur in self._stmts.values():
+            try:
+                cur.close()
+            except Exception:
+                pass
+        self._stmts.clear()
+        self._col_names.clear()
+        try:
+            self.conn.close()
+        except Exception:
+            pass
 
     def _cursor(self):
         cur = self.conn.cursor()
         cur.arraysize = self.arraysize
+        cur.prefetchrows = self.arraysize + 1
         return cur
 
+    def _prepared(self, sql: str) -> oracledb.Cursor:
+        """Cursor with `sql` prepared once; run it with cur.execute(None, owner=...)."""
+        cur = self._stmts.get(sql)
+        if cur is None:
+            cur = self._cursor()
+            cur.prepare(sql)
+            self._stmts[sql] = cur
+        return cur
+
+    def _column_names(self, cursor) -> Tuple[str, ...]:
+        """Lowercase result column names; computed once for cursors from _prepared."""
+        names = self._col_names.get(id(cursor))
+        if names is None:
+            names = tuple(d[0].lower() for d in cursor.description)
+            if self._stmts.get(cursor.statement) is cursor:
+                self._col_names[id(cursor)] = names
+        return names
+
+    def _iter_rows(self, cursor) -> Iterator[Dict]:
+        """Yield rows as dicts (lowercase keys), fetching `arraysize` rows at a time."""
+        cols = self._column_names(cursor)
+        while True:
+            batch = cursor.fetchmany(self.arraysize)
+            if not batch:
+                return
+            for r in batch:
+                yield dict(zip(cols, r))
+
+    def _iter_records(self, cursor) -> Iterator[Tuple]:
+        """Yield rows as namedtuples (lowercase fields) for rows that are only grouped, not returned."""
+        cursor.rowfactory = _row_type(self._column_names(cursor))._make
+        while True:
+            batch = cursor.fetchmany(self.arraysize)
+            if not batch:
+                return
+            yield from batch
+
     def _rows(self, cursor) -> List[Dict]:
-        cols = [d[0].lower() for d in cursor.description]
-        return [dict(zip(cols, r)) for r in cursor.fetchall()]
+        return list(self._iter_rows(cursor))
 
     def set_current_schema(self, owner: str) -> None:
         """Best-effort: point USER* views at a specific schema."""
@@ -54,188 +278,117 @@ class OracleIntrospector:
         exclude_tables: Optional[Iterable[str]] = None,
     ) -> List[Dict]:
         owner = owner or self.cfg.owner
-        sql = """
-            SELECT table_name, 
-                    temporary,
-                    num_rows
-            FROM all_tables
-            WHERE  owner = :owner
-            ORDER  BY table_name
-        """
-        with self._cursor() as cur:
-            cur.execute(sql, owner=owner)
-            rows = self._rows(cur)
-
-        # prototype-friendly name filters (case-insensitive exact matches)
-        if include_tables:
-            want = {t.lower() for t in include_tables}
-            rows = [r for r in rows if r["table_name"].lower() in want]
-        if exclude_tables:
-            drop = {t.lower() for t in exclude_tables}
-            rows = [r for r in rows if r["table_name"].lower() not in drop]
-        # normalize NUM_ROWS (may be NULL if stats are stale/missing)
-        for r in rows:
-            if "num_rows" in r and r["num_rows"] is not None:
-                r["num_rows"] = int(r["num_rows"])
-        return rows
+        cur = self._prepared(TABLES_SQL)
+        cur.execute(None, owner=owner)
+        return _shape_tables(self._iter_rows(cur), include_tables, exclude_tables)
 
     def get_columns(self, owner: Optional[str] = None) -> List[Dict]:
         owner = owner or self.cfg.owner
-        sql = """
-            SELECT table_name,
-                   column_name,
-                   data_type,
-                   data_precision,
-                   data_scale,
-                   nullable,
-                   data_default
-            FROM   all_tab_columns
-            WHERE  owner = :owner
-            ORDER  BY table_name, column_id
-        """
-        with self._cursor() as cur:
-            cur.execute(sql, owner=owner)
-            rows = self._rows(cur)
-
-        for r in rows:
-            r["nullable"] = (r.get("nullable") == "Y")
-            if isinstance(r.get("data_default"), str):
-                r["data_default"] = r["data_default"].strip()
-        return rows
+        cur = self._prepared(COLUMNS_SQL)
+        cur.execute(None, owner=owner)
+        return _shape_columns(self._iter_rows(cur))
 
     def get_pk(self, owner: Optional[str] = None) -> List[Dict]:
         owner = owner or self.cfg.owner
-        sql = """
-            SELECT c.table_name,
-                   c.constraint_name,
-                   cc.column_name,
-                   cc.position
-            FROM   all_constraints c
-            JOIN   all_cons_columns cc
-              ON cc.owner = c.owner AND cc.constraint_name = c.constraint_name
-            WHERE  c.owner = :owner
-              AND  c.constraint_type = 'P'
-            ORDER  BY c.table_name, c.constraint_name, cc.position
-        """
-        with self._cursor() as cur:
-            cur.execute(sql, owner=owner)
-            rows = self._rows(cur)
-
-        grouped: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
-        for r in rows:
-            key = (r["table_name"], r["constraint_name"])
-            grouped.setdefault(key, []).append((r["position"], r["column_name"]))
-
-        result: List[Dict] = []
-        for (tbl, cn), cols in grouped.items():
-            cols.sort(key=lambda x: x[0])
-            result.append({"table_name": tbl, "constraint_name": cn, "columns": [c for _, c in cols]})
-        return result
+        cur = self._prepared(PK_SQL)
+        cur.execute(None, owner=owner)
+        return _group_pk(self._iter_records(cur))
 
     def get_fk(self, owner: Optional[str] = None) -> List[Dict]:
         owner = owner or self.cfg.owner
-        sql = """
-            SELECT fk.constraint_name AS fk_name,
-                   fk.table_name      AS fk_table,
-                   fk.delete_rule,
-                   fkc.column_name    AS fk_col,
-                   fkc.position       AS pos,
-                   pk.table_name      AS pk_table,
-                   pkc.column_name    AS pk_col
-            FROM   all_constraints fk
-            JOIN   all_constraints pk
-              ON pk.owner = fk.r_owner
-             AND pk.constraint_name = fk.r_constraint_name
-            JOIN   all_cons_columns fkc
-              ON fkc.owner = fk.owner
-             AND fkc.constraint_name = fk.constraint_name
-            JOIN   all_cons_columns pkc
-              ON pkc.owner = pk.owner
-             AND pkc.constraint_name = pk.constraint_name
-             AND pkc.position = fkc.position
-            WHERE  fk.owner = :owner
-              AND  fk.constraint_type = 'R'
-            ORDER  BY fk.table_name, fk.constraint_name, fkc.position
-        """
-        with self._cursor() as cur:
-            cur.execute(sql, owner=owner)
-            rows = self._rows(cur)
-
-        grouped, meta = {}, {}
-        for r in rows:
-            k = (r["fk_name"], r["fk_table"])
-            grouped.setdefault(k, []).append((r["pos"], r["fk_col"], r["pk_col"]))
-            meta[k] = {"r_table_name": r["pk_table"], "delete_rule": r["delete_rule"]}
-
-        out: List[Dict] = []
-        for (name, table), triples in grouped.items():
-            triples.sort(key=lambda x: x[0])
-            out.append({
-                "constraint_name": name,
-                "table_name": table,
-                "columns": [c for _, c, _ in triples],
-                "r_table_name": meta[(name, table)]["r_table_name"],
-                "r_columns": [c for _, _, c in triples],
-                "delete_rule": meta[(name, table)]["delete_rule"],
-            })
-        return out
+        cur = self._prepared(FK_SQL)
+        cur.execute(None, owner=owner)
+        return _group_fk(self._iter_records(cur))
 
     def get_indexes(self, owner: Optional[str] = None) -> List[Dict]:
         owner = owner or self.cfg.owner
-        idx_sql = """
-            SELECT index_name, table_name, uniqueness
-            FROM   all_indexes
-            WHERE  owner = :owner
-            ORDER  BY table_name, index_name
-        """
-        ic_sql = """
-            SELECT index_name, table_name, column_name, column_position
-            FROM   all_ind_columns
-            WHERE  index_owner = :owner
-            ORDER  BY table_name, index_name, column_position
-        """
-        with self._cursor() as cur:
-            cur.execute(idx_sql, owner=owner)
-            idxs = self._rows(cur)
-            cur.execute(ic_sql, owner=owner)
-            cols = self._rows(cur)
-
-        by_idx: Dict[Tuple[str, str], List[Tuple[int, str]]] = {}
-        for r in cols:
-            key = (r["table_name"], r["index_name"])
-            by_idx.setdefault(key, []).append((r["column_position"], r["column_name"]))
-
-        out: List[Dict] = []
-        for r in idxs:
-            key = (r["table_name"], r["index_name"])
-            collist = [c for _, c in sorted(by_idx.get(key, []))]
-            out.append({
-                "index_name": r["index_name"],
-                "table_name": r["table_name"],
-                "uniqueness": r["uniqueness"],  # 'UNIQUE' / 'NONUNIQUE'
-                "columns": collist
-            })
-        return out
+        cur = self._prepared(INDEXES_SQL)
+        cur.execute(None, owner=owner)
+        return _group_indexes(self._iter_records(cur))
 
     def get_sequences(self, owner: Optional[str] = None) -> List[Dict]:
         owner = owner or self.cfg.owner
-        sql = """
-            SELECT sequence_name,
-                   increment_by,
-                   min_value,
-                   max_value,
-                   cache_size,
-                   cycle_flag,
-                   order_flag,
-                   last_number
-            FROM   all_sequences
-            WHERE  sequence_owner = :owner
-            ORDER  BY sequence_name
+        cur = self._prepared(SEQUENCES_SQL)
+        cur.execute(None, owner=owner)
+        return self._rows(cur)
+
+    def fetch_all_metadata(self, owner: Optional[str] = None) -> Optional[Dict[str, List[Dict]]]:
         """
-        with self._cursor() as cur:
-            cur.execute(sql, owner=owner)
-            return self._rows(cur)
-        
+        Send all six metadata queries in one round-trip with oracledb pipelining
+        (async thin connection, Oracle 23ai+). Returns the same dict as get_all,
+        or None when the server can't pipeline.
+        """
+        owner = owner or self.cfg.owner
+        queries = [TABLES_SQL, COLUMNS_SQL, PK_SQL, FK_SQL, INDEXES_SQL, SEQUENCES_SQL]
+
+        async def run():
+            conn = await oracledb.connect_async(user=self.cfg.user, password=self.cfg.password, dsn=self.cfg.dsn)
+            try:
+                if int(conn.version.split(".")[0]) < 23:
+                    return None
+                pipeline = oracledb.create_pipeline()
+                for sql in queries:
+                    pipeline.add_fetchall(sql, {"owner": owner}, arraysize=self.arraysize)
+                return await conn.run_pipeline(pipeline)
+            finally:
+                await conn.close()
+
+        results = asyncio.run(run())
+        if results is None:
+            return None
+        def dicts(res) -> List[Dict]:
+            names = [c.name.lower() for c in res.columns]
+            return [dict(zip(names, r)) for r in res.rows]
+
+        def records(res) -> Iterator[Tuple]:
+            return map(_row_type(tuple(c.name.lower() for c in res.columns))._make, res.rows)
+
+        tables, cols, pks, fks, idxs, seqs = results
+        tables, cols, seqs = dicts(tables), dicts(cols), dicts(seqs)
+        pks, fks, idxs = records(pks), records(fks), records(idxs)
+        return {
+            "tables": _shape_tables(tables),
+            "cols": _shape_columns(cols),
+            "pks": _group_pk(pks),
+            "fks": _group_fk(fks),
+            "idxs": _group_indexes(idxs),
+            "seqs": seqs,
+        }
+
+    def get_all(self, owner: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Fetch all metadata in one pipelined round-trip when the server supports it
+        (see fetch_all_metadata). Otherwise run the six metadata queries concurrently,
+        each on its own short-lived connection (a single oracledb connection serializes its calls).
+        Returns {'tables', 'cols', 'pks', 'fks', 'idxs', 'seqs'} -> rows.
+        """
+        try:
+            meta = self.fetch_all_metadata(owner)
+        except Exception:
+            meta = None
+        if meta is not None:
+            return meta
+
+        jobs = {
+            "tables": "get_tables",
+            "cols": "get_columns",
+            "pks": "get_pk",
+            "fks": "get_fk",
+            "idxs": "get_indexes",
+            "seqs": "get_sequences",
+        }
+
+        def run(method: str) -> List[Dict]:
+            worker = OracleIntrospector(self.cfg)
+            try:
+                return getattr(worker, method)(owner)
+            finally:
+                worker.close()
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+            futs = {key: ex.submit(run, method) for key, method in jobs.items()}
+            return {key: fut.result() for key, fut in futs.items()}
+
     def count_table(self, owner: Optional[str], table_name: str) -> Optional[int]:
         """
         Return exact COUNT(*) for owner.table_name, or None on error.
@@ -253,4 +406,27 @@ class OracleIntrospector:
                 n, = cur.fetchone()
                 return int(n)
         except Exception:
-            return None
\ No newline at end of file
+            return None
+
+    def count_tables(self, owner: Optional[str], table_names: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Return exact COUNT(*) for many tables of one owner, one UNION ALL query per COUNT_CHUNK_TABLES tables.
+        Falls back to count_table per table (None on error) for a chunk whose combined query fails.
+        """
+        if not table_names:
+            return {}
+        owner = (owner or self.cfg.owner) or ""
+        qowner = owner.replace('"', '""')
+        qtables = [t.replace('"', '""') for t in table_names]
+        counts: Dict[str, Optional[int]] = {}
+        for start in range(0, len(table_names), COUNT_CHUNK_TABLES):
+            chunk = range(start, min(start + COUNT_CHUNK_TABLES, len(table_names)))
+            sql = " UNION ALL ".join(f'SELECT {i}, COUNT(*) FROM "{qowner}"."{qtables[i]}"' for i in chunk)
+            try:
+                with self._cursor() as cur:
+                    cur.execute(sql)
+                    found = dict(cur.fetchall())
+                counts.update((table_names[i], int(found[i])) for i in chunk)
+            except Exception:
+                counts.update((table_names[i], self.count_table(owner, table_names[i])) for i in chunk)
+        return counts
\ No newline at end of file
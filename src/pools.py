@@ -0,0 +1,77 @@
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import oracledb
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError:  # optional: callers fall back to plain connections
+    ConnectionPool = None
+
+# Connection pools shared by the loader and the validator. They are per process (worker processes
+# cannot share sockets), keyed by target and by os.getpid(): forked workers inherit the parent's
+# entries (open sockets, no pool threads), so they must never look them up, only build their own
+_ORA_POOLS: Dict[Tuple[int, str, str], Any] = {}
+_PG_POOLS: Dict[Tuple[int, str], Any] = {}
+_POOLS_LOCK = threading.Lock()
+
+def _reset_pools_lock() -> None:
+    # A fork can copy the lock while another parent thread holds it
+    global _POOLS_LOCK
+    _POOLS_LOCK = threading.Lock()
+
+os.register_at_fork(after_in_child=_reset_pools_lock)
+
+def ora_pool(user: str, password: str, dsn: str, max_size: int) -> oracledb.ConnectionPool:
+    """
+    Oracle session pool for (user, dsn) in this process, created on first use.
+    `max_size` only applies to the call that creates it.
+    """
+    key = (os.getpid(), user, dsn)
+    with _POOLS_LOCK:
+        pool = _ORA_POOLS.get(key)
+        if pool is None:
+            pool = oracledb.create_pool(
+                user=user,
+                password=password,
+                dsn=dsn,
+                min=1,
+                max=max(1, max_size),
+                increment=1,
+                # Speeding up connections; repeated statements reuse their parsed cursors
+                stmtcachesize=50,
+                # Largest session data unit: fewer network packets per fetch
+                sdu=65535,
+            )
+            _ORA_POOLS[key] = pool
+    return pool
+
+def pg_pool(dsn: str, max_size: int) -> Optional[Any]:
+    """
+    Postgres connection pool for `dsn` in this process, or None if psycopg_pool is not installed.
+    Callers set autocommit on each checkout; pooled connections keep whatever the last user left.
+    """
+    if ConnectionPool is None:
+        return None
+    key = (os.getpid(), dsn)
+    with _POOLS_LOCK:
+        pool = _PG_POOLS.get(key)
+        if pool is None:
+            pool = ConnectionPool(dsn, min_size=1, max_size=max(1, max_size), open=True)
+            _PG_POOLS[key] = pool
+    return pool
+
+def close_pools() -> None:
+    """ Close every pool this process opened. """
+    pid = os.getpid()
+    with _POOLS_LOCK:
+        pools = [p for k, p in _ORA_POOLS.items() if k[0] == pid] + [p for k, p in _PG_POOLS.items() if k[0] == pid]
+        for registry in (_ORA_POOLS, _PG_POOLS):
+            for k in [k for k in registry if k[0] == pid]:
+                del registry[k]
+    for pool in pools:
+        try:
+            pool.close()
+        except Exception:
+            pass
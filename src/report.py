@@ -1,16 +1,45 @@
+import os
+from typing import Any
+
 from config import OutputCfg
 
+# Buffered report bytes are written out once they reach this size
+REPORT_FLUSH_BYTES = 64 * 1024
+
 class Report:
     """ Reporter class that can be logged to and tracks what to be displayed to user at the end of operation. """
     
     def __init__(self, out: OutputCfg):
         self.report = out.report_md
-        file = open(self.report, "w")
-        file.close()
+        # Raw fd plus our own byte buffer: no TextIOWrapper encoder/lock per message
+        self._fd = os.open(self.report, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        self._buf = bytearray()
+
+    def log_report(self, message: Any):
+        self._buf += str(message).encode("utf-8")
+        self._buf += b"\n"
+        if len(self._buf) >= REPORT_FLUSH_BYTES:
+            self.flush()
+
+    def flush(self):
+        """ Makes everything logged so far visible in the report file. """
+        view = memoryview(self._buf)
+        while view:
+            view = view[os.write(self._fd, view):]
+        view.release()
+        self._buf.clear()
+
+    def close(self):
+        if self._fd < 0:
+            return
+        try:
+            self.flush()
+        finally:
+            os.close(self._fd)
+            self._fd = -1
 
-    def log_report(self, message: str):
-        with open(self.report, "a+") as file:
-            file.write(str(message))
-            file.write("\n")
+    def __enter__(self) -> "Report":
+        return self
 
-    
\ No newline at end of file
+    def __exit__(self, *exc) -> None:
+        self.close()
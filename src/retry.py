@@ -0,0 +1,28 @@
+import random
+import sys
+import time
+from typing import Any, Callable
+
+import psycopg
+
+# Postgres errors worth retrying: the failed transaction left nothing behind and a rerun may succeed
+RETRYABLE_ERRORS = (
+    psycopg.errors.SerializationFailure,
+    psycopg.errors.DeadlockDetected,
+    psycopg.OperationalError,
+)
+
+def with_retry(fn: Callable[..., Any], *args: Any, attempts: int = 3, base: float = 0.2) -> Any:
+    """
+    Call fn(*args), retrying RETRYABLE_ERRORS with exponential backoff plus jitter
+    (base * 2**k + random() seconds). Other errors, and the last failure, propagate.
+    """
+    for k in range(attempts):
+        try:
+            return fn(*args)
+        except RETRYABLE_ERRORS as e:
+            if k == attempts - 1:
+                raise
+            delay = base * 2 ** k + random.random()
+            sys.stderr.write(f"[WARN] Transient Postgres error, retrying in {delay:.1f}s: {e!r}\n")
+            time.sleep(delay)
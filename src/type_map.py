@@ -1,5 +1,8 @@
+from functools import lru_cache
+from types import MappingProxyType
 
-dict = {
+# Oracle type name -> Postgres type name (read-only)
+_ORA_TO_PG = MappingProxyType({
     "NUMBER" : "numeric",
     "VARCHAR2" : "varchar",
     "NVARCHAR2" : "char",
@@ -35,15 +38,14 @@ dict = {
     "SDO_GeoRaster" : "geometry",
     "BOOLEAN" : "boolean",
     "JSON" : "jsonb",
-}
+})
 
+@lru_cache(maxsize=256)
 def map_type(ora_type, precision=None, scale=None):
-    mapping = dict.get(ora_type)
-    if mapping is None:
-        return
-    else :
-        if precision is not None and scale is not None:
-            return f"{mapping}({precision},{scale})"
-        if scale is not None:
-            return f"{mapping}({precision})"
-    return mapping
+    """ Postgres type for an Oracle (type, precision, scale); memoized, schemas repeat the same few shapes. """
+    mapping = _ORA_TO_PG.get(ora_type)
+    # Only a full (precision, scale) pair carries over. Scale alone (NUMBER(*,s), TIMESTAMP)
+    # used to yield '<type>(None)'; precision alone (FLOAT binary precision) has no PG equivalent
+    if mapping is None or precision is None or scale is None:
+        return mapping
+    return f"{mapping}({precision},{scale})"
@@ -1,27 +1,146 @@
 import oracledb
 import psycopg
+from psycopg import sql
 from sys import stderr
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple
 from config import OracleCfg, PostgresCfg
 from report import Report
 import typer
+import pools
+
+# Tables per UNION ALL query; keeps very large schemas under parser/statement limits
+COUNT_CHUNK_TABLES = 200
+
+@contextmanager
+def _pg_conn(postgres: PostgresCfg) -> Iterator[psycopg.Connection]:
+    """ Autocommit Postgres connection: from the shared pool when psycopg_pool is installed, else a fresh one. """
+    pool = pools.pg_pool(postgres.dsn, postgres.copy_parallelism * 2)
+    if pool is None:
+        with psycopg.connect(postgres.dsn, autocommit=True) as conn:
+            yield conn
+        return
+    with pool.connection() as conn:
+        # Read-only counts: no transaction to open or close around each query
+        conn.autocommit = True
+        yield conn
+
+@lru_cache(maxsize=4096)
+def _ora_ident(name: str) -> str:
+    """ Quoted Oracle identifier, case kept as introspected (like TableSpec); cached, the single-table fallback reuses chunk names. """
+    return '"' + name.replace('"', '""') + '"'
+
+@lru_cache(maxsize=1024)
+def _ora_count_sql(ora_owner: str, chunk: Tuple[Tuple[int, str], ...]) -> str:
+    # Branch i counts tables[i]; the index maps results back to table names
+    return " UNION ALL ".join(f'SELECT {i}, COUNT(*) FROM {ora_owner}.{_ora_ident(t)}' for i, t in chunk)
+
+@lru_cache(maxsize=1024)
+def _pg_count_sql(schema: str, chunk: Tuple[Tuple[int, str], ...]) -> sql.Composed:
+    # Quoted like the loader's COPY targets, so reserved words (e.g. "order") work
+    return sql.SQL(" UNION ALL ").join(
+        sql.SQL("SELECT {}, COUNT(*) FROM {}.{}").format(
+            sql.Literal(i), sql.Identifier(schema), sql.Identifier(t.lower())
+        )
+        for i, t in chunk
+    )
+
+def count_oracle(ora: oracledb.Connection, owner: str, tables: List[str], errors: Dict[int, str]) -> Dict[int, int]:
+    """ {index in tables: COUNT(*)} from Oracle, one UNION ALL per COUNT_CHUNK_TABLES tables.
+    A failing chunk is recounted table by table; per-table failures land in `errors`. """
+    counts: Dict[int, int] = {}
+    # Only the user-supplied owner is normalized, as in TableSpec
+    ora_owner = _ora_ident(owner.upper())
+    with ora.cursor() as oc:
+        # One read-only snapshot for all chunks; ended by the rollback below
+        try:
+            oc.execute("SET TRANSACTION READ ONLY")
+        except oracledb.DatabaseError:
+            pass  # a transaction is already open on this session; count in it
+        # A chunk returns up to COUNT_CHUNK_TABLES rows: fetch them with the execute round-trip
+        oc.arraysize = COUNT_CHUNK_TABLES
+        oc.prefetchrows = COUNT_CHUNK_TABLES + 1
+        for start in range(0, len(tables), COUNT_CHUNK_TABLES):
+            chunk = tuple(enumerate(tables[start:start + COUNT_CHUNK_TABLES], start))
+            try:
+                oc.execute(_ora_count_sql(ora_owner, chunk))
+                counts.update(oc.fetchall())
+                continue
+            except Exception:
+                pass
+            # One bad table fails the whole UNION ALL; isolate it
+            for i, t in chunk:
+                try:
+                    oc.execute(_ora_count_sql(ora_owner, ((i, t),)))
+                    counts.update(oc.fetchall())
+                except Exception as e:
+                    errors[i] = f"oracle: {e}"
+    ora.rollback()
+    return counts
+
+def count_pg(pg: psycopg.Connection, schema: str, tables: List[str], errors: Dict[int, str]) -> Dict[int, int]:
+    """ {index in tables: COUNT(*)} from Postgres, one UNION ALL per COUNT_CHUNK_TABLES tables.
+    A failing chunk is recounted table by table; per-table failures land in `errors`. """
+    counts: Dict[int, int] = {}
+    # In autocommit a failed query aborts nothing; otherwise each query gets a savepoint
+    guard = nullcontext if pg.autocommit else pg.transaction
+    with pg.cursor() as pc:
+        for start in range(0, len(tables), COUNT_CHUNK_TABLES):
+            chunk = tuple(enumerate(tables[start:start + COUNT_CHUNK_TABLES], start))
+            try:
+                with guard():
+                    # Server-side prepared: later validations reuse the plan for the same text
+                    pc.execute(_pg_count_sql(schema, chunk), prepare=True)
+                counts.update(pc.fetchall())
+                continue
+            except Exception:
+                pass
+            for i, t in chunk:
+                try:
+                    with guard():
+                        pc.execute(_pg_count_sql(schema, ((i, t),)), prepare=True)
+                    counts.update(pc.fetchall())
+                except Exception as e:
+                    errors[i] = f"postgres: {e}"
+    return counts
 
 def validate_counts(oracle: OracleCfg, postgres: PostgresCfg, tables: List[str], owner:str, report: Report) -> Dict[str, dict]:
+    """ Compares per-table row counts; one UNION ALL round-trip per database for every COUNT_CHUNK_TABLES tables.
+    Both databases are counted concurrently, each on its own thread and connection.
+    Connections come from the per-process pools shared with the loader (see pools.close_pools).
+    A table that can't be counted gets {"match": False, "error": ...} without affecting the others;
+    if a connection fails, every table gets one. """
     out: Dict[str, dict] = {}
-    ora = oracledb.connect(user=oracle.user, password=oracle.password, dsn=oracle.dsn)
-    pg = psycopg.connect(postgres.dsn)
+    if not tables:
+        return out
+    ora_errors: Dict[int, str] = {}
+    pg_errors: Dict[int, str] = {}
     try:
-        oc = ora.cursor()
-        pc = pg.cursor()
-        for t in tables:
-            oc.execute(f'SELECT COUNT(*) FROM "{owner.upper()}"."{t.upper()}"')
-            ocount = oc.fetchone()[0]
-            pc.execute(f'SELECT COUNT(*) FROM {postgres.schema}.{t.lower()}')
-            pcount = pc.fetchone()[0]
-            out[t] = {"oracle": ocount, "postgres": pcount, "match": (ocount == pcount)}
-    except:
-        typer.secho("Error in validating row counts.", fg="yellow")
-        report.log_report("Error in validating row counts.")
-    finally:
-        ora.close(); pg.close()
+        ora_pool = pools.ora_pool(oracle.user, oracle.password, oracle.dsn, postgres.copy_parallelism * 2)
+        with ora_pool.acquire() as ora, _pg_conn(postgres) as pg:
+            # Both drivers release the GIL while waiting on the network
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                fo = ex.submit(count_oracle, ora, owner, tables, ora_errors)
+                fp = ex.submit(count_pg, pg, postgres.schema, tables, pg_errors)
+                ocounts, pcounts = fo.result(), fp.result()
+    except Exception as e:
+        # Connection-level failure: nothing was counted, so nothing is known to match
+        typer.secho(f"Error in validating row counts: {e}", fg="yellow")
+        if report is not None:
+            report.log_report(f"Error in validating row counts: {e}")
+            report.flush()
+        return {t: {"oracle": None, "postgres": None, "match": False, "error": repr(e)} for t in tables}
+    for i, t in enumerate(tables):
+        ocount, pcount = ocounts.get(i), pcounts.get(i)
+        out[t] = {"oracle": ocount, "postgres": pcount, "match": (ocount == pcount)}
+        errs = [e for e in (ora_errors.get(i), pg_errors.get(i)) if e]
+        if errs:
+            out[t]["match"] = False
+            out[t]["error"] = "; ".join(errs)
+            if report is not None:
+                report.log_report(f"Count error {t}: {out[t]['error']}")
+    if report is not None and (ora_errors or pg_errors):
+        report.flush()
     return out